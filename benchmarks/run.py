@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+"""
+Headless benchmarks for matplotgl.
+
+The widgets are connected to a recording comm instead of a kernel, so the suite
+runs without a browser or a Jupyter server. For every operation, the wall time,
+the peak memory allocated (as traced by ``tracemalloc``, which includes numpy
+buffers), and the number and size of the messages sent to the frontend are
+reported. The size of a message is the length of its JSON content plus the size
+of its binary buffers.
+
+Usage:
+
+    python benchmarks/run.py
+    python benchmarks/run.py --max-size 1e8 --json results.json
+    python benchmarks/run.py --only line,zoom
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import comm
+import ipywidgets as ipw
+import numpy as np
+
+import matplotgl as mg
+
+
+class RecordingComm(comm.base_comm.BaseComm):
+    """
+    A comm which drops the messages, only counting them and their size.
+    """
+    messages = 0
+    nbytes = 0
+
+    def publish_msg(self, msg_type, data=None, metadata=None, buffers=None, **keys):
+        RecordingComm.messages += 1
+        RecordingComm.nbytes += len(json.dumps(data, default=str))
+        for buffer in buffers or []:
+            RecordingComm.nbytes += memoryview(buffer).nbytes
+
+
+def measure(func, *args):
+    """
+    Run ``func(*args)`` and return its wall time, peak memory and message counts.
+    """
+    RecordingComm.messages = 0
+    RecordingComm.nbytes = 0
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        'time': wall,
+        'peak_memory': peak,
+        'messages': RecordingComm.messages,
+        'bytes': RecordingComm.nbytes
+    }
+    ipw.Widget.close_all()
+    return result
+
+
+def _xy(size):
+    x = np.linspace(0, 100, size)
+    return x, np.sin(x) + np.random.random(size)
+
+
+def bench_line(size):
+    _, ax = mg.subplots()
+    x, y = _xy(size)
+    return measure(ax.plot, x, y)
+
+
+def bench_line_decimated(size):
+    _, ax = mg.subplots()
+    x, y = _xy(size)
+    return measure(lambda: ax.plot(x, y, decimate=True))
+
+
+def bench_points(size):
+    _, ax = mg.subplots()
+    x, y = np.random.random((2, size))
+    return measure(ax.scatter, x, y)
+
+
+def bench_image(size):
+    _, ax = mg.subplots()
+    side = int(np.sqrt(size))
+    return measure(ax.imshow, np.random.random((side, side)))
+
+
+def bench_zoom(size):
+    _, ax = mg.subplots()
+    x, y = _xy(size)
+    ax.plot(x, y, decimate=True)
+    return measure(ax.zoom, [40, 60, -1, 2])
+
+
+def bench_subplots(nrows):
+    return measure(mg.subplots, nrows, nrows)
+
+
+# Benchmarks parametrized by data size
+SIZE_BENCHMARKS = {
+    'line': bench_line,
+    'line_decimated': bench_line_decimated,
+    'points': bench_points,
+    'image': bench_image,
+    'zoom': bench_zoom,
+}
+
+# Benchmarks parametrized by the number of rows and columns of subplots
+GRID_BENCHMARKS = {'subplots': bench_subplots}
+
+
+def run(max_size=1e7, only=None):
+    comm.create_comm = RecordingComm
+    sizes = [int(10**p) for p in range(3, int(np.log10(max_size)) + 1)]
+    results = []
+    for name, func in SIZE_BENCHMARKS.items():
+        if only is None or name in only:
+            results += [dict(name=name, param=size, **func(size)) for size in sizes]
+    for name, func in GRID_BENCHMARKS.items():
+        if only is None or name in only:
+            results += [dict(name=name, param=n, **func(n)) for n in (1, 2, 5, 10)]
+    return results
+
+
+def print_table(results):
+    print(f'{"benchmark":<16}{"param":>12}{"time [ms]":>12}{"peak [MB]":>12}'
+          f'{"messages":>10}{"sent [MB]":>12}')
+    for r in results:
+        print(f'{r["name"]:<16}{r["param"]:>12}{1e3 * r["time"]:>12.2f}'
+              f'{r["peak_memory"] / 1e6:>12.2f}{r["messages"]:>10}'
+              f'{r["bytes"] / 1e6:>12.3f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-size',
+                        type=float,
+                        default=1e7,
+                        help='largest data size in the sweep starting at 1e3')
+    parser.add_argument('--only', help='comma-separated list of benchmarks to run')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+    results = run(max_size=args.max_size,
+                  only=None if args.only is None else args.only.split(','))
+    print_table(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
@@ -3,8 +3,10 @@
 
 # flake8: noqa F401
 
+from . import animation
 from .axes import Axes
 from .figure import Figure
 from .plot import plot
 from .imshow import imshow
+from .instrument import instrument
 from .subplots import subplots
@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+from contextlib import nullcontext
+
+import matplotlib as mpl
+import numpy as np
+import pythreejs as p3
+
+from .artist import Artist
+from .cache import release, shared
+from .encoding import unpack
+from .points import Points
+from .utils import colormap_lut, lut_indices
+
+# Number of points binned at once, to bound the size of temporary arrays
+_CHUNK_SIZE = 1 << 22
+
+# Resolution of the histogram before the artist is added to an axes
+_DEFAULT_BINS = 512
+
+
+class AggregatedPoints(Artist):
+    """
+    Points too numerous to be sent individually, drawn as a density image.
+
+    The points inside the visible range are binned into a 2D histogram with one bin
+    per screen pixel, which is colour-mapped (on a logarithmic scale) into a
+    texture. Empty bins are transparent. The histogram is recomputed for the new
+    visible range on every zoom, and once the number of visible points drops below
+    ``threshold``, the raw points are drawn instead.
+
+    Parameters
+    ----------
+    x:
+        The x coordinates, or an (N, 2) array of positions.
+    y:
+        The y coordinates.
+    cmap:
+        The colormap of the density image.
+    threshold:
+        The number of visible points below which the raw points are shown.
+    zorder:
+        The depth of the image and points.
+    **kwargs:
+        Forwarded to the :class:`Points` drawing the raw points. Per-point colour
+        values (``c``) and sizes (``s``) are sliced with the visible points.
+    """
+
+    def __init__(self,
+                 x,
+                 y=None,
+                 cmap='viridis',
+                 threshold=100_000,
+                 zorder=0,
+                 **kwargs):
+
+        super().__init__(zorder=zorder)
+        _, self._x, self._y = unpack(x, y)
+        self._lut = colormap_lut(mpl.colormaps[cmap])
+        self._threshold = threshold
+        # Per-point arrays are sliced with the visible points, and the colour limits
+        # are fixed so that colours do not change with the visible subset
+        self._point_arrays = {}
+        for key in ('c', 's'):
+            value = kwargs.get(key)
+            if value is not None and not np.isscalar(value):
+                value = np.asarray(value)
+                if len(value) != len(self._x):
+                    raise ValueError(f'Expected {len(self._x)} values for {key}, got '
+                                     f'{len(value)}.')
+                self._point_arrays[key] = value
+        if 'c' in self._point_arrays:
+            kwargs.setdefault('vmin', np.nanmin(self._point_arrays['c']))
+            kwargs.setdefault('vmax', np.nanmax(self._point_arrays['c']))
+        self._points_kwargs = {
+            key: value
+            for key, value in kwargs.items() if key not in self._point_arrays
+        }
+        self._box = None
+        self._points = None
+
+        # The texture is made on the first zoom, as its shape cannot change
+        self._texture = None
+        self._material = p3.MeshBasicMaterial(transparent=True)
+        self._geometry = shared(p3.PlaneGeometry,
+                                width=1,
+                                height=1,
+                                widthSegments=1,
+                                heightSegments=1)
+        self._image = p3.Mesh(geometry=self._geometry,
+                              material=self._material,
+                              visible=False)
+        self._group = p3.Group(children=[self._image])
+
+    def _bins(self):
+        if self._ax is None:
+            return _DEFAULT_BINS, _DEFAULT_BINS
+        return int(self._ax.width), int(self._ax.height)
+
+    def _histogram(self, box, nx, ny):
+        """
+        Count the points falling in each of the ``nx * ny`` bins covering ``box``.
+        """
+        counts = np.zeros(nx * ny, dtype=np.int64)
+        sx = nx / (box[1] - box[0])
+        sy = ny / (box[3] - box[2])
+        xs, ys = self._scaled_data()
+        for start in range(0, len(xs), _CHUNK_SIZE):
+            x = xs[start:start + _CHUNK_SIZE]
+            y = ys[start:start + _CHUNK_SIZE]
+            inside = (x >= box[0]) & (x < box[1]) & (y >= box[2]) & (y < box[3])
+            ix = ((x[inside] - box[0]) * sx).astype(np.intp)
+            iy = ((y[inside] - box[2]) * sy).astype(np.intp)
+            # Guard against rounding up to nx (or ny) at the upper edge
+            np.minimum(ix, nx - 1, out=ix)
+            np.minimum(iy, ny - 1, out=iy)
+            counts += np.bincount(iy * nx + ix, minlength=nx * ny)
+        return counts.reshape(ny, nx)
+
+    def _select(self, box):
+        """
+        Return the data coordinates of the points inside ``box``, and their
+        per-point colour values and sizes.
+        """
+        ind = []
+        scaled_x, scaled_y = self._scaled_data()
+        for start in range(0, len(self._x), _CHUNK_SIZE):
+            x = scaled_x[start:start + _CHUNK_SIZE]
+            y = scaled_y[start:start + _CHUNK_SIZE]
+            inside = (x >= box[0]) & (x < box[1]) & (y >= box[2]) & (y < box[3])
+            ind.append(np.flatnonzero(inside) + start)
+        ind = np.concatenate(ind)
+        arrays = {key: value[ind] for key, value in self._point_arrays.items()}
+        return self._x[ind], self._y[ind], arrays
+
+    def _make_colors(self, counts):
+        """
+        Colour-map the bin counts into an RGBA texture, with empty bins transparent.
+        """
+        density = np.log1p(counts, dtype='float32')
+        colors = self._lut[lut_indices(density, 0, max(density.max(), 1))]
+        colors[counts == 0, 3] = 0
+        return colors
+
+    def _apply_zoom(self, box):
+        self._box = box
+        self._request_view(box)
+
+    def _compute_view(self, box):
+        """
+        Return either the visible points, or the colours of the density image.
+        """
+        nx, ny = self._bins()
+        counts = self._histogram(box, nx, ny)
+        if counts.sum() <= self._threshold:
+            return box, self._select(box), None
+        return box, None, self._make_colors(counts)
+
+    def _apply_view(self, result):
+        box, points, colors = result
+        if points is not None:
+            x, y, arrays = points
+            if self._points is None:
+                self._points = Points(x,
+                                      y,
+                                      zorder=self._zorder,
+                                      **self._points_kwargs,
+                                      **arrays)
+                self._points.set_axes(self._ax)
+                if not (self._get_scale('x').linear and self._get_scale('y').linear):
+                    # The points were encoded before they knew the axis scales
+                    self._points._rescale()
+                self._group.add(self._points.get())
+            else:
+                fig = self._ax.get_figure()
+                # Send the positions and the per-point arrays together
+                with nullcontext() if fig is None else fig.batch_update():
+                    self._points.set_data(np.stack([x, y], axis=1))
+                    if 'c' in arrays:
+                        self._points.set_array(arrays['c'])
+                    if 's' in arrays:
+                        self._points.set_sizes(arrays['s'])
+                self._points.get().visible = True
+            self._image.visible = False
+            return
+        if self._texture is not None and self._texture.data.shape == colors.shape:
+            self._texture.data = colors
+        else:
+            # The axes were resized: a texture of the new shape is needed
+            old, self._texture = self._texture, p3.DataTexture(
+                data=colors,
+                format='RGBAFormat',
+                type='UnsignedByteType',
+                magFilter='NearestFilter',
+                minFilter='NearestFilter')
+            self._material.map = self._texture
+            if old is not None:
+                old.close()
+        with self._image.hold_sync():
+            self._image.position = (0.5 * (box[0] + box[1]), 0.5 * (box[2] + box[3]),
+                                    self._zorder - 50)
+            self._image.scale = (box[1] - box[0], box[3] - box[2], 1)
+            self._image.visible = True
+        if self._points is not None:
+            self._points.get().visible = False
+
+    def _get_data(self):
+        return self._x, self._y
+
+    def _pick(self, x, y, scale, radius):
+        return self._nearest_sample(x, y, scale, radius)
+
+    def _rescale(self):
+        super()._rescale()
+        if self._points is not None:
+            self._points._rescale()
+
+    def _release(self):
+        release(self._geometry)
+        self._material.close()
+        if self._texture is not None:
+            self._texture.close()
+        if self._points is not None:
+            self._points._release()
+
+    def get(self):
+        return self._group
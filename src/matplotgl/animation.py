@@ -0,0 +1,256 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+import asyncio
+import itertools
+import time
+
+import pythreejs as p3
+
+
+class FuncAnimation:
+    """
+    Animate a figure by calling ``func(frame, *fargs)`` for each frame, at most
+    once every ``interval`` milliseconds.
+
+    Frames are shown on a fixed schedule: when the kernel falls behind (because
+    ``func`` or the figure updates take longer than ``interval``), the frames
+    whose time has passed are dropped instead of being queued, and are counted in
+    ``dropped_frames``. All the updates made by ``func`` in one frame are sent
+    together, see :meth:`Figure.batch_update`.
+
+    With ``precompute=True``, ``func`` is called for every frame up front, and the
+    vertices and image values it sets on lines, points and images are recorded
+    and sent once, each artist's frames packed into a single contiguous buffer.
+    Playback then only switches which frame is visible, without serializing any
+    data. Other changes made by ``func`` (colours, limits, labels) are not
+    recorded in this mode. When the animation stops, the artists are set to the
+    frame shown last.
+
+    The animation runs on the kernel's event loop. Without a running event loop
+    (e.g. in a script), :meth:`start` plays the frames once and returns when done,
+    which requires a finite number of frames.
+
+    Parameters
+    ----------
+    fig:
+        The figure to animate.
+    func:
+        The function updating the artists for a frame.
+    frames:
+        The number of frames, or an iterable of the values passed to ``func``. If
+        ``None``, frames are numbered without end (not supported with
+        ``precompute``).
+    fargs:
+        Additional arguments passed to ``func``.
+    interval:
+        The minimum time between frames, in milliseconds.
+    repeat:
+        Whether to start again after the last frame.
+    precompute:
+        Whether to compute all the frames before playing them.
+    autostart:
+        Whether to start playing immediately.
+
+    Examples
+    --------
+
+      fig, ax = matplotgl.subplots()
+      line = ax.plot(x, np.sin(x))
+
+      def update(i):
+          line.set_data(np.stack([x, np.sin(x + 0.1 * i)], axis=1))
+
+      anim = matplotgl.animation.FuncAnimation(fig, update, frames=100, interval=40)
+    """
+
+    def __init__(self,
+                 fig,
+                 func,
+                 frames=None,
+                 fargs=None,
+                 interval=50,
+                 repeat=True,
+                 precompute=False,
+                 autostart=True):
+        self._fig = fig
+        self._func = func
+        self._fargs = tuple(fargs or ())
+        self._interval = interval / 1000
+        self._repeat = repeat
+        self._endless = frames is None
+        if self._endless:
+            if precompute:
+                raise ValueError('Precomputed animations need a finite number of '
+                                 'frames.')
+            frames = itertools.count()
+        elif isinstance(frames, int):
+            frames = range(frames)
+        self._frames = frames
+        self._iterator = None
+        self._frame = None
+        self._start_time = None
+        self._position = 0
+        self._handle = None
+        # Precomputed frames: {artist: (states, group, objects)}
+        self._precomputed = None
+        self._index = None
+        self.shown_frames = 0
+        self.dropped_frames = 0
+        if precompute:
+            self._precompute()
+        if autostart:
+            self.start()
+
+    def _precompute(self):
+        """
+        Call ``func`` for every frame, recording the data of the artists it changes.
+        The artist updates are captured as in a batch update, but never sent.
+        """
+        frames = list(self._frames)
+        fig = self._fig
+        initial = {}
+        for ax in fig.axes:
+            for artist in ax._artists:
+                try:
+                    initial[artist] = artist._frame_state()
+                except (TypeError, ValueError):
+                    continue
+        states = {}
+        fig._batch_depth += 1
+        try:
+            for i, frame in enumerate(frames):
+                self._func(frame, *self._fargs)
+                changed, fig._dirty_artists = fig._dirty_artists, []
+                for artist in changed:
+                    artist._dirty = set()
+                    if artist not in states:
+                        # Raises if the artist cannot be precomputed
+                        state = artist._frame_state()
+                        states[artist] = [initial[artist]] * i + [state]
+                    else:
+                        states[artist].append(artist._frame_state())
+                for artist, values in states.items():
+                    if len(values) == i:
+                        values.append(values[-1])
+            # Put the artists back in the state their widgets are showing
+            for artist in states:
+                artist._set_frame_state(initial[artist])
+            for artist in fig._dirty_artists:
+                artist._dirty = set()
+            fig._dirty_artists = []
+        finally:
+            fig._batch_depth -= 1
+        self._precomputed = {}
+        for artist, values in states.items():
+            objects = artist._make_frames(values)
+            self._precomputed[artist] = (values, p3.Group(children=objects), objects)
+        self._frames = range(len(frames))
+
+    def _next_frame(self, skip):
+        """
+        Advance by ``skip + 1`` frames, restarting at the end if repeating. Returns
+        ``False`` when the animation is over.
+        """
+        for _ in range(skip + 1):
+            try:
+                self._frame = next(self._iterator)
+            except StopIteration:
+                # Iterators (as opposed to sequences) cannot be replayed
+                if not self._repeat or iter(self._frames) is self._frames:
+                    return False
+                self._iterator = iter(self._frames)
+                try:
+                    self._frame = next(self._iterator)
+                except StopIteration:
+                    return False
+        return True
+
+    def _show(self):
+        if self._precomputed is None:
+            with self._fig.batch_update():
+                self._func(self._frame, *self._fargs)
+            return
+        for _, _, objects in self._precomputed.values():
+            if self._index is not None:
+                objects[self._index].visible = False
+            objects[self._frame].visible = True
+        self._index = self._frame
+
+    def _tick(self, now):
+        """
+        Show the frame due at time ``now``, dropping those whose time has passed.
+        Returns the time of the next frame, or ``None`` when the animation is over.
+        """
+        due = int((now - self._start_time) / self._interval)
+        skip = max(due - self._position, 0)
+        if not self._next_frame(skip):
+            self.stop()
+            return None
+        self.dropped_frames += skip
+        self._position += skip + 1
+        self._show()
+        self.shown_frames += 1
+        return self._start_time + self._position * self._interval
+
+    def _run(self, loop):
+        next_time = self._tick(loop.time())
+        if next_time is not None:
+            self._handle = loop.call_at(next_time, self._run, loop)
+
+    def start(self):
+        """
+        Start (or resume from the first frame) playing the animation.
+        """
+        self.stop()
+        self._iterator = iter(self._frames)
+        self._position = 0
+        if self._precomputed is not None:
+            for artist, (_, group, _) in self._precomputed.items():
+                artist.get().visible = False
+                artist._ax.scene.add(group)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            self._start_time = loop.time()
+            self._run(loop)
+            return
+        # Without an event loop, play the frames once, blocking
+        if self._endless:
+            raise RuntimeError('Without a running event loop, animations are played '
+                               'once, blocking: pass a finite number of frames.')
+        self._repeat = False
+        self._start_time = time.monotonic()
+        next_time = self._tick(self._start_time)
+        while next_time is not None:
+            time.sleep(max(next_time - time.monotonic(), 0))
+            next_time = self._tick(time.monotonic())
+
+    def stop(self):
+        """
+        Stop playing. With precomputed frames, the artists are set to the data of
+        the frame shown last.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._precomputed is None or self._iterator is None:
+            return
+        self._iterator = None
+        with self._fig.batch_update():
+            for artist, (states, group, objects) in self._precomputed.items():
+                if self._index is not None:
+                    objects[self._index].visible = False
+                    artist._set_frame_state(states[self._index])
+                artist._ax.scene.remove(group)
+                artist.get().visible = True
+        self._index = None
+
+    @property
+    def running(self):
+        """
+        Whether the animation is playing.
+        """
+        return self._handle is not None
@@ -0,0 +1,311 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+import threading
+
+import numpy as np
+
+from .scale import LINEAR
+from .spatial import GridIndex
+
+
+class Artist:
+    """
+    Base class for everything that can be added to an :class:`Axes`.
+    """
+
+    def __init__(self, zorder=0):
+        self._ax = None
+        self._zorder = zorder
+        self._bbox = None
+        self._dirty = set()
+        # Spatial index of the samples for hover and picking, made on first use
+        self._spatial = None
+        # Coordinates transformed by non-linear axis scales: {dim: (scale, array)}
+        self._scaled = {}
+
+    def set_axes(self, ax):
+        self._ax = ax
+
+    def get_axes(self):
+        return self._ax
+
+    def get_bbox(self):
+        """
+        Return the data limits of the artist, or ``None`` if it has no data (e.g. a
+        stream which nothing was appended to yet). The limits are computed on first
+        access and cached until the data changes.
+        """
+        if self._bbox is None:
+            self._bbox = self._compute_bbox()
+        return self._bbox
+
+    def _compute_bbox(self):
+        """
+        The limits of the samples returned by ``_get_data`` in scene coordinates,
+        with a margin of 3% of their range on each side.
+        """
+        pad = 0.03
+        x, y = self._scaled_data()
+        if len(x) == 0:
+            return None
+        xmin = np.nanmin(x)
+        xmax = np.nanmax(x)
+        padx = pad * (xmax - xmin)
+        ymin = np.nanmin(y)
+        ymax = np.nanmax(y)
+        pady = pad * (ymax - ymin)
+        return {
+            'left': xmin - padx,
+            'right': xmax + padx,
+            'bottom': ymin - pady,
+            'top': ymax + pady
+        }
+
+    def _invalidate_bbox(self):
+        """
+        Drop the cached limits, and tell the parent axes its merged limits are stale.
+        """
+        self._bbox = None
+        if self._ax is not None:
+            self._ax._invalidate_bounds()
+
+    def get(self):
+        raise NotImplementedError
+
+    def _pick(self, x, y, scale, radius):
+        """
+        Find what the artist shows at the point ``(x, y)``, for hover and picking.
+        Returns ``(distance, info)``, with the distance to the point in pixels and a
+        dict describing the sample (``'x'``, ``'y'``, and ``'index'`` or
+        ``'value'``), or ``None`` if nothing is within ``radius`` pixels.
+
+        Parameters
+        ----------
+        x:
+            The x coordinate of the point.
+        y:
+            The y coordinate of the point.
+        scale:
+            The number of pixels per data unit along x and y.
+        radius:
+            The search radius, in pixels.
+        """
+        return None
+
+    def _nearest_sample(self, x, y, scale, radius):
+        """
+        Implementation of :meth:`_pick` for artists made of samples, using a spatial
+        index of the data returned by ``_get_data``, in scene coordinates.
+        """
+        if self._spatial is None:
+            self._spatial = GridIndex(*self._scaled_data())
+        hit = self._spatial.query(x, y, scale, radius)
+        if hit is None:
+            return None
+        index, distance = hit
+        px, py = self._spatial.position(index)
+        return distance, {'index': index, 'x': px, 'y': py}
+
+    def _get_scale(self, dim):
+        if self._ax is None:
+            return LINEAR
+        return self._ax._xscale if dim == 'x' else self._ax._yscale
+
+    def _check_scale(self, scale):
+        """
+        Raise if the artist cannot be drawn on an axis with the given scale.
+        """
+        return
+
+    def _scale_values(self, dim, values):
+        """
+        Transform the ``x`` or ``y`` coordinates of the artist with the scale of that
+        dimension. The float32 result is cached until the data or the scale change,
+        so that switching the scale of one axis reuses the other dimension.
+
+        The cache is only filled on the main thread: the view recomputations
+        running in the figure's thread pool (see :class:`ViewExecutor`) could
+        otherwise store a transform of data replaced meanwhile.
+        """
+        scale = self._get_scale(dim)
+        if scale.linear:
+            return values
+        cached = self._scaled.get(dim)
+        if cached is not None and cached[0] == scale and len(cached[1]) == len(values):
+            return cached[1]
+        scaled = scale.forward(values, dtype='float32')
+        if threading.current_thread() is threading.main_thread():
+            self._scaled[dim] = (scale, scaled)
+        return scaled
+
+    def _scaled_data(self):
+        """
+        The coordinates returned by ``_get_data``, in scene coordinates.
+        """
+        x, y = self._get_data()
+        return self._scale_values('x', x), self._scale_values('y', y)
+
+    def _transform(self, x, y):
+        """
+        Transform coordinates other than the artist data (e.g. animation frames)
+        into scene coordinates, without caching.
+        """
+        return (self._get_scale('x').forward(x, dtype='float32'),
+                self._get_scale('y').forward(y, dtype='float32'))
+
+    def _rescale(self):
+        """
+        Redraw the artist after the scale of an axis changed.
+        """
+        self._spatial = None
+        self._invalidate_bbox()
+        self._request_send('position')
+
+    def _data_changed(self, appended=False):
+        """
+        Drop the caches derived from the data after it changed: the transformed
+        coordinates and the spatial index. If samples were only appended, the
+        new samples are transformed and added to the caches instead.
+        """
+        if not appended:
+            self._scaled = {}
+            self._spatial = None
+            return
+        data = dict(zip('xy', self._get_data()))
+        for dim, (scale, old) in self._scaled.items():
+            new = scale.forward(data[dim][len(old):], dtype='float32')
+            self._scaled[dim] = (scale, np.concatenate([old, new]))
+        if self._spatial is not None:
+            self._spatial.extend(*self._scaled_data())
+
+    def remove(self):
+        """
+        Remove the artist from its axes, and release the widgets it shares with other
+        artists.
+        """
+        if self._ax is not None:
+            self._cancel_view()
+            self._ax._remove_artist(self)
+            self._ax = None
+            self._reset_view()
+        self._release()
+
+    def _reset_view(self):
+        """
+        Forget the visible range given by the axes, after the artist is removed from
+        them.
+        """
+        return
+
+    def _export_overrides(self, quantize, max_points):
+        """
+        Return the trait values replacing those of the artist widgets when saving the
+        figure with :meth:`Figure.save_html`, as a ``{widget: {trait: value}}`` dict.
+
+        Parameters
+        ----------
+        quantize:
+            Whether to reduce the precision of positions and colours.
+        max_points:
+            The maximum number of vertices to keep, or ``None``.
+        """
+        return {}
+
+    def _frame_state(self):
+        """
+        Return a copy of the data animated by :class:`FuncAnimation` in precompute
+        mode (vertices, image values).
+        """
+        raise TypeError(f'{type(self).__name__} does not support precomputed '
+                        'animation frames.')
+
+    def _set_frame_state(self, state):
+        """
+        Restore data returned by :meth:`_frame_state`, and send it.
+        """
+        raise NotImplementedError
+
+    def _make_frames(self, states):
+        """
+        Make one hidden threejs object per frame, drawing the data returned by
+        :meth:`_frame_state` for each frame. The frame data are stored in a single
+        contiguous buffer.
+        """
+        raise NotImplementedError
+
+    def _release(self):
+        """
+        Release the shared widgets used by the artist.
+        """
+        return
+
+    def _apply_zoom(self, box):
+        """
+        Hook called by the parent axes whenever the visible range changes.
+
+        Parameters
+        ----------
+        box:
+            The new visible range as ``[xmin, xmax, ymin, ymax]``.
+        """
+        return
+
+    def _request_view(self, box):
+        """
+        Recompute the view-dependent data of the artist for the range ``box``. The
+        work done by :meth:`_compute_view` runs in the figure's thread pool, and the
+        result is sent by :meth:`_apply_view` once ready, unless a newer range has
+        been requested meanwhile.
+        """
+        fig = None if self._ax is None else self._ax.get_figure()
+        if fig is None:
+            self._apply_view(self._compute_view(box))
+        else:
+            fig._submit_view(self, lambda: self._compute_view(box), self._apply_view)
+
+    def _cancel_view(self):
+        """
+        Drop the pending view recomputation, when the data it was computed from is
+        replaced.
+        """
+        fig = None if self._ax is None else self._ax.get_figure()
+        if fig is not None:
+            fig._cancel_view(self)
+
+    def _compute_view(self, box):
+        """
+        Compute the data needed to draw the range ``box``. This runs in a worker
+        thread, and must not modify any widget.
+        """
+        raise NotImplementedError
+
+    def _apply_view(self, result):
+        """
+        Send the result of :meth:`_compute_view` to the frontend.
+        """
+        raise NotImplementedError
+
+    def _request_send(self, *parts):
+        """
+        Send the given parts of the artist (e.g. ``'position'``) to the frontend. If
+        the figure is inside :meth:`Figure.batch_update`, the parts are only marked
+        as dirty, and sent once when the batch ends.
+        """
+        fig = None if self._ax is None else self._ax.get_figure()
+        if fig is not None and fig._batch_depth:
+            if not self._dirty:
+                fig._dirty_artists.append(self)
+            self._dirty.update(parts)
+        else:
+            self._send(set(parts))
+
+    def _flush(self):
+        parts, self._dirty = self._dirty, set()
+        self._send(parts)
+
+    def _send(self, parts):
+        """
+        Rebuild and send the buffers corresponding to the given parts.
+        """
+        return
@@ -1,12 +1,37 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
 
+from contextlib import contextmanager
+
 import ipywidgets as ipw
 import pythreejs as p3
-from matplotlib import ticker
 import numpy as np
 
-from .utils import value_to_string
+from .cache import shared
+from .scale import Scale
+from .ticks import TICK_STYLE, locate_ticks, tick_bins
+from .utils import Debouncer, value_to_string
+
+# Half-length of the crosshairs delimiting the zoom rectangle, large enough to
+# always span the view
+_CROSSHAIR_LENGTH = 1.0e20
+
+# Distance from the mouse, in pixels, within which samples are found by hover and
+# picking
+_PICK_RADIUS = 8
+
+
+class _ShareGroup:
+    """
+    Axes sharing their x (or y) range. The camera bounds and tick labels of the
+    axes in a group are linked in the frontend, and their cameras are all placed at
+    the same ``origin`` along the shared dimension, so that the linked bounds show
+    the same range.
+    """
+
+    def __init__(self, axes):
+        self.axes = axes
+        self.origin = None
 
 
 class Axes(ipw.GridBox):
@@ -22,40 +47,46 @@ class Axes(ipw.GridBox):
         self._artists = []
         self._lines = []
         self._collections = []
-
-        # Make background to enable box zoom
-        self._background_geometry = p3.PlaneGeometry(width=2,
-                                                     height=2,
-                                                     widthSegments=1,
-                                                     heightSegments=1)
-        self._background_material = p3.MeshBasicMaterial(color=self.background_color,
-                                                         #  side='DoubleSide'
-                                                         )
+        # Merged limits of all artists, None when they need to be recomputed
+        self._data_bounds = _merge_bboxes([])
+        self._autoscale_hold = 0
+        self._autoscale_pending = False
+        self._pending_objects = []
+
+        # Make background to enable box zoom. The unit plane is resized with the
+        # mesh scale, so that autoscaling does not need to send a new geometry, and
+        # it is shared with all the other axes and images.
+        self._background_geometry = shared(p3.PlaneGeometry,
+                                           width=1,
+                                           height=1,
+                                           widthSegments=1,
+                                           heightSegments=1)
+        self._background_material = shared(p3.MeshBasicMaterial,
+                                           color=self.background_color)
         self._background_mesh = p3.Mesh(geometry=self._background_geometry,
                                         material=self._background_material,
-                                        position=(0, 0, -200))
-
-        self._zoom_down_picker = p3.Picker(controlling=self._background_mesh,
-                                           event='mousedown')
-        self._zoom_up_picker = p3.Picker(controlling=self._background_mesh,
-                                         event='mouseup')
-        self._zoom_move_picker = p3.Picker(controlling=self._background_mesh,
-                                           event='mousemove')
-
-        self._zoom_rect_geometry = p3.BufferGeometry(
-            attributes={
-                'position': p3.BufferAttribute(array=np.zeros((5, 3), dtype='float32')),
-            })
-        self._zoom_rect_line = p3.Line(geometry=self._zoom_rect_geometry,
-                                       material=p3.LineBasicMaterial(color='black',
-                                                                     linewidth=1),
-                                       visible=False)
+                                        **self._background_transform())
+
+        # The box zoom pickers and crosshairs are only made when zoom is first
+        # enabled, see _zoom_tools
+        self._zoom_down_picker = None
+        self._zoom_up_picker = None
+        self._zoom_move_picker = None
+        self._zoom_rect = None
+        self._zoom_active = False
+
+        # Hover and picking are opt-in, see set_hover and on_pick
+        self._hover_picker = None
+        self._hover_active = False
+        self._click_picker = None
+        self._tooltip = None
+        self._hover_marker = None
+        self._pick_callbacks = []
 
         self.camera = p3.OrthographicCamera(-0.001, 1.0, 1.0, -0.001, -1, 300)
 
-        self.scene = p3.Scene(
-            children=[self.camera, self._background_mesh, self._zoom_rect_line],
-            background=self.background_color)
+        self.scene = p3.Scene(children=[self.camera, self._background_mesh],
+                              background=self.background_color)
 
         self.controls = p3.OrbitControls(controlling=self.camera,
                                          enableZoom=False,
@@ -71,26 +102,41 @@ class Axes(ipw.GridBox):
                                     })
 
         self._zoom_mouse_down = False
-        self._zoom_mouse_moved = False
+        self._zoom_down_point = None
         self._zoom_xmin = None
         self._zoom_xmax = None
         self._zoom_ymin = None
         self._zoom_ymax = None
+        # Mapping of the data to scene coordinates, see set_xscale
+        self._xscale = Scale()
+        self._yscale = Scale()
+        # Last (key, html) of the tick labels, to skip rebuilding unchanged ticks
+        self._xticks = (None, '')
+        self._yticks = (None, '')
+        # The range last given to the artists
+        self._view_box = None
+        # The camera position last set from Python, to tell frontend pans apart
+        self._camera_position = None
+        # Groups of axes sharing the x or y range, see sharex and sharey
+        self._sharex = None
+        self._sharey = None
+        self._links = []
+        # Panning moves the camera in the frontend; follow it once it settles
+        self.camera.observe(Debouncer(self._on_camera_move, delay=0.1),
+                            names='position')
 
         self._leftspine = ipw.HTML(self._make_yticks(bottom=self.ymin, top=self.ymax),
                                    layout={'grid_area': 'leftspine'})
-        self._rightspine = ipw.HTML(layout={'grid_area': 'rightspine'})
         self._bottomspine = ipw.HTML(self._make_xticks(left=self.xmin, right=self.xmax),
                                      layout={'grid_area': 'bottomspine'})
-        self._topspine = ipw.HTML(layout={'grid_area': 'topspine', 'display': 'none'})
-        self._title = ipw.HTML(layout={'grid_area': 'title'})
-        self._xlabel = ipw.HTML(layout={'grid_area': 'xlabel'})
-        self._ylabel = ipw.HTML(layout={'grid_area': 'ylabel'})
-
-        super().__init__(children=[
-            self._xlabel, self._ylabel, self._title, self._leftspine, self._rightspine,
-            self._bottomspine, self._topspine, self.renderer
-        ],
+        # Labels and empty spines are only made when they are set, see _html
+        self._rightspine = None
+        self._topspine = None
+        self._title = None
+        self._xlabel = None
+        self._ylabel = None
+
+        super().__init__(children=[self._leftspine, self._bottomspine, self.renderer],
                          layout=ipw.Layout(
                              grid_template_columns=f'80px {self.width}px 50px',
                              grid_template_rows=f'35px {self.height}px 35px',
@@ -100,33 +146,190 @@ class Axes(ipw.GridBox):
             "leftspine bottomspine bottomspine"
             '''))
 
+    def _zoom_tools(self):
+        """
+        Make the pickers and crosshairs used by the box zoom, on first use. Returns
+        the mousedown, mouseup and mousemove pickers.
+        """
+        if self._zoom_down_picker is None:
+            self._zoom_down_picker = p3.Picker(controlling=self._background_mesh,
+                                               event='mousedown')
+            self._zoom_up_picker = p3.Picker(controlling=self._background_mesh,
+                                             event='mouseup')
+            self._zoom_move_picker = p3.Picker(controlling=self._background_mesh,
+                                               event='mousemove')
+
+            # The zoom rectangle is drawn in the frontend as the area between two
+            # crosshairs, linked to the mousedown and mousemove pickers with jsdlink.
+            # Dragging therefore needs no round trip to the kernel: Python is only
+            # involved on mousedown (to show the crosshairs) and mouseup (to zoom).
+            crosshair = np.array([[-1, 0, 0], [1, 0, 0], [0, -1, 0], [0, 1, 0]],
+                                 dtype='float32') * _CROSSHAIR_LENGTH
+            crosshair_geometry = p3.BufferGeometry(
+                attributes={'position': p3.BufferAttribute(array=crosshair)})
+            crosshair_material = shared(p3.LineBasicMaterial,
+                                        color='black',
+                                        linewidth=1)
+            self._zoom_down_cross = p3.LineSegments(geometry=crosshair_geometry,
+                                                    material=crosshair_material)
+            self._zoom_move_cross = p3.LineSegments(geometry=crosshair_geometry,
+                                                    material=crosshair_material)
+            # Picked points lie on the background: shift the crosshairs in front of it
+            self._zoom_rect = p3.Group(
+                children=[self._zoom_down_cross, self._zoom_move_cross],
+                position=(0, 0, -self._background_mesh.position[-1]),
+                visible=False)
+            self._zoom_links = [
+                ipw.jsdlink((self._zoom_down_picker, 'point'),
+                            (self._zoom_down_cross, 'position')),
+                ipw.jsdlink((self._zoom_move_picker, 'point'),
+                            (self._zoom_move_cross, 'position'))
+            ]
+            self.scene.add(self._zoom_rect)
+        return self._zoom_down_picker, self._zoom_up_picker, self._zoom_move_picker
+
+    def _update_controls(self):
+        """
+        Give the renderer the orbit controls and the active pickers.
+        """
+        controls = [self.controls]
+        if self._zoom_active:
+            controls.extend(self._zoom_tools())
+        if self._hover_active:
+            controls.append(self._hover_picker)
+        if self._click_picker is not None:
+            controls.append(self._click_picker)
+        self.renderer.controls = controls
+
+    def set_hover(self, enabled=True):
+        """
+        Show the values of the data under the mouse in a tooltip. The sample nearest
+        to the mouse is found with a spatial index of each line and set of points,
+        made on first use, and images show the value of the pixel under the mouse.
+
+        Parameters
+        ----------
+        enabled:
+            Whether to show the tooltip.
+        """
+        if enabled and self._hover_picker is None:
+            self._hover_picker = p3.Picker(controlling=self._background_mesh,
+                                           event='mousemove')
+            self._hover_picker.observe(self._on_hover, names=['point'])
+            self._tooltip = ipw.HTML(
+                layout={
+                    'grid_area': 'renderer',
+                    'width': '0px',
+                    'height': '0px',
+                    'overflow': 'visible'
+                })
+            self._hover_marker = p3.Points(geometry=p3.BufferGeometry(
+                attributes={
+                    'position': p3.BufferAttribute(
+                        array=np.zeros((1, 3), dtype='float32'))
+                }),
+                                           material=shared(p3.PointsMaterial,
+                                                           color='black',
+                                                           size=8),
+                                           visible=False)
+            self.children += (self._tooltip, )
+            self.scene.add(self._hover_marker)
+        self._hover_active = enabled
+        if not enabled:
+            self._hide_tooltip()
+        self._update_controls()
+
+    def on_pick(self, callback):
+        """
+        Call ``callback(event)`` when the axes are clicked. The event is a dict with
+        the ``'artist'`` nearest to the click, and the ``'x'`` and ``'y'``
+        coordinates and ``'index'`` (for lines and points) or ``'value'`` (for
+        images and points with colour values) of the sample that was picked.
+
+        Parameters
+        ----------
+        callback:
+            The function to call.
+        """
+        if self._click_picker is None:
+            self._click_picker = p3.Picker(controlling=self._background_mesh,
+                                           event='click')
+            self._click_picker.observe(self._on_click, names=['point'])
+            self._update_controls()
+        self._pick_callbacks.append(callback)
+
+    def _pick(self, x, y):
+        """
+        Find the sample nearest to the point ``(x, y)`` among all the artists.
+        Returns the artist, the description of the sample (in data coordinates) and
+        its position in scene coordinates, or ``None``.
+        """
+        box = self._visible_box()
+        scale = (self.width / (box[1] - box[0]), self.height / (box[3] - box[2]))
+        best = None
+        for artist in self._artists:
+            hit = artist._pick(x, y, scale, _PICK_RADIUS)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = (hit[0], artist, hit[1])
+        if best is None:
+            return None
+        _, artist, info = best
+        position = (info['x'], info['y'])
+        info['x'] = self._xscale.inverse(info['x'])[()]
+        info['y'] = self._yscale.inverse(info['y'])[()]
+        return artist, info, position
+
+    def _on_hover(self, change):
+        x, y = change['new'][:2]
+        hit = self._pick(x, y)
+        if hit is None:
+            self._hide_tooltip()
+            return
+        _, info, (px, py) = hit
+        box = self._visible_box()
+        left = (px - box[0]) / (box[1] - box[0]) * self.width
+        top = (box[3] - py) / (box[3] - box[2]) * self.height
+        lines = [f'x: {value_to_string(info["x"])}', f'y: {value_to_string(info["y"])}']
+        if 'value' in info:
+            lines.append(f'value: {value_to_string(info["value"])}')
+        self._tooltip.value = (
+            '<div style="position:relative;">'
+            f'<div style="position:absolute; left:{left + 10:.0f}px; '
+            f'top:{top + 10:.0f}px; pointer-events:none; white-space:nowrap; '
+            'background:rgba(255,255,255,0.9); border:solid 1px #888; '
+            f'padding:2px 4px; font-size:0.9em;">{"<br>".join(lines)}</div></div>')
+        with self._hover_marker.hold_sync():
+            self._hover_marker.position = (px, py, 0)
+            self._hover_marker.visible = True
+
+    def _hide_tooltip(self):
+        if self._tooltip is not None:
+            self._tooltip.value = ''
+            self._hover_marker.visible = False
+
+    def _on_click(self, change):
+        x, y = change['new'][:2]
+        hit = self._pick(x, y)
+        if hit is None:
+            return
+        artist, info, _ = hit
+        event = dict(info, artist=artist)
+        for callback in self._pick_callbacks:
+            callback(event)
+
     def on_mouse_down(self, change):
         self._zoom_mouse_down = True
-        x, y, z = change['new']
-        self._zoom_rect_line.geometry.attributes['position'].array = np.array(
-            [[x, x, x, x, x], [y, y, y, y, y], [0, 0, 0, 0, 0]], dtype='float32').T
-        self._zoom_rect_line.visible = True
+        self._zoom_down_point = change['new']
+        self._zoom_rect.visible = True
 
-    def on_mouse_up(self, *ignored):
+    def on_mouse_up(self, change):
         if self._zoom_mouse_down:
             self._zoom_mouse_down = False
-            self._zoom_rect_line.visible = False
-            if self._zoom_mouse_moved:
-                array = self._zoom_rect_line.geometry.attributes['position'].array
-                self.zoom([
-                    array[:, 0].min(), array[:, 0].max(), array[:, 1].min(),
-                    array[:, 1].max()
-                ])
-                self._zoom_mouse_moved = False
-
-    def on_mouse_move(self, change):
-        if self._zoom_mouse_down:
-            self._zoom_mouse_moved = True
-            x, y, z = change['new']
-            new_pos = self._zoom_rect_line.geometry.attributes['position'].array.copy()
-            new_pos[2:4, 0] = x
-            new_pos[1:3, 1] = y
-            self._zoom_rect_line.geometry.attributes['position'].array = new_pos
+            self._zoom_rect.visible = False
+            x0, y0 = self._zoom_down_point[:2]
+            x1, y1 = change['new'][:2]
+            if (x0 != x1) and (y0 != y1):
+                self.zoom([min(x0, x1), max(x0, x1), min(y0, y1), max(y0, y1)])
 
     @property
     def width(self):
@@ -145,135 +348,483 @@ class Axes(ipw.GridBox):
         self.renderer.height = h
 
     def autoscale(self):
-        xmin = np.inf
-        xmax = np.NINF
-        ymin = np.inf
-        ymax = np.NINF
+        if self._autoscale_hold:
+            self._autoscale_pending = True
+            return
+        if not self._artists:
+            return
+        xaxes = self._shared_axes(self._sharex)
+        yaxes = self._shared_axes(self._sharey)
+        xbounds = _merge_bboxes([ax._get_data_bounds() for ax in xaxes if ax._artists])
+        ybounds = _merge_bboxes([ax._get_data_bounds() for ax in yaxes if ax._artists])
+        # The limits are kept while all the artists are empty
+        if xbounds['left'] <= xbounds['right']:
+            for ax in xaxes:
+                ax.xmin = xbounds['left']
+                ax.xmax = xbounds['right']
+        if ybounds['bottom'] <= ybounds['top']:
+            for ax in yaxes:
+                ax.ymin = ybounds['bottom']
+                ax.ymax = ybounds['top']
+        for group in (self._sharex, self._sharey):
+            if group is not None:
+                group.origin = None
+
+        for ax in dict.fromkeys(xaxes + yaxes):
+            with ax._background_mesh.hold_sync():
+                for key, value in ax._background_transform().items():
+                    setattr(ax._background_mesh, key, value)
+            ax.reset()
+
+    def _get_data_bounds(self):
+        if self._data_bounds is None:
+            self._data_bounds = _merge_bboxes(
+                [artist.get_bbox() for artist in self._artists])
+        return self._data_bounds
+
+    def _shared_axes(self, group):
+        return [self] if group is None else list(group.axes)
+
+    def sharex(self, other):
+        """
+        Share the x range with another axes. The camera bounds and tick labels are
+        linked in the frontend, so that zooming one of the axes updates the others
+        without any round trip to the kernel.
+
+        Parameters
+        ----------
+        other:
+            The axes to share the range with. Its limits are adopted.
+        """
+        self._share(other, '_sharex', ('left', 'right'), '_bottomspine')
+
+    def sharey(self, other):
+        """
+        Share the y range with another axes, see :meth:`sharex`.
+
+        Parameters
+        ----------
+        other:
+            The axes to share the range with. Its limits are adopted.
+        """
+        self._share(other, '_sharey', ('bottom', 'top'), '_leftspine')
+
+    def _share(self, other, attr, bounds, spine):
+        group = getattr(other, attr)
+        if group is None:
+            group = _ShareGroup([other])
+            setattr(other, attr, group)
+        dim = 0 if attr == '_sharex' else 1
+        if group.origin is None:
+            group.origin = other.camera.position[dim]
+        joining = [
+            ax for ax in self._shared_axes(getattr(self, attr)) if ax not in group.axes
+        ]
+        self._links.extend(
+            ipw.jslink((other.camera, name), (self.camera, name)) for name in bounds)
+        self._links.append(
+            ipw.jslink((getattr(other, spine), 'value'),
+                       (getattr(self, spine), 'value')))
+        # The joining axes adopt the limits and visible range of the other axes, with
+        # their cameras placed at the origin of the group
+        limits = ('xmin', 'xmax') if dim == 0 else ('ymin', 'ymax')
+        scale = '_xscale' if dim == 0 else '_yscale'
+        view = other._visible_box()
+        for ax in joining:
+            ax._apply_scale(scale, getattr(other, scale))
+        for ax in joining:
+            group.axes.append(ax)
+            setattr(ax, attr, group)
+            for name in limits:
+                setattr(ax, name, getattr(other, name))
+            box = list(ax._view_box or ax._visible_box())
+            box[2 * dim:2 * dim + 2] = view[2 * dim:2 * dim + 2]
+            ax._set_camera_box(box)
+            ax._update_ticks(box)
+            ax._apply_zoom(box)
+
+    def set_xscale(self, scale, linthresh=1.0):
+        """
+        Set the scale of the x axis. On ``'log'`` and ``'symlog'`` axes, the
+        coordinates of each artist are transformed once and cached until its data
+        changes, and the tick labels show the data values. Changing the x scale
+        reuses the transformed y coordinates, and does not touch other axes (except
+        those sharing the x range, see :meth:`sharex`, which follow). Values which
+        are not positive are not drawn on log axes, and images can only be drawn on
+        linear axes.
+
+        Parameters
+        ----------
+        scale:
+            ``'linear'``, ``'log'`` or ``'symlog'``.
+        linthresh:
+            For ``'symlog'``, the range ``(-linthresh, linthresh)`` around zero
+            within which the axis is linear.
+        """
+        self._set_scale('_xscale', Scale(scale, linthresh=linthresh), self._sharex)
+
+    def get_xscale(self):
+        return self._xscale.name
+
+    def set_yscale(self, scale, linthresh=1.0):
+        """
+        Set the scale of the y axis, see :meth:`set_xscale`.
+
+        Parameters
+        ----------
+        scale:
+            ``'linear'``, ``'log'`` or ``'symlog'``.
+        linthresh:
+            For ``'symlog'``, the range ``(-linthresh, linthresh)`` around zero
+            within which the axis is linear.
+        """
+        self._set_scale('_yscale', Scale(scale, linthresh=linthresh), self._sharey)
+
+    def get_yscale(self):
+        return self._yscale.name
+
+    def _set_scale(self, attr, scale, group):
+        axes = [ax for ax in self._shared_axes(group) if getattr(ax, attr) != scale]
+        if not axes:
+            return
+        for ax in axes:
+            for artist in ax._artists:
+                artist._check_scale(scale)
+        for ax in axes:
+            ax._apply_scale(attr, scale)
+        # The limits are in the coordinates of the previous scale
+        owner = next((ax for ax in axes if ax._artists), None)
+        if owner is not None:
+            owner.autoscale()
+        else:
+            for ax in axes:
+                ax.reset()
+
+    def _apply_scale(self, attr, scale):
+        """
+        Change the scale of one dimension and redraw the artists, without updating
+        the limits.
+        """
+        if getattr(self, attr) == scale:
+            return
+        for artist in self._artists:
+            artist._check_scale(scale)
+        setattr(self, attr, scale)
         for artist in self._artists:
-            lims = artist.get_bbox()
-            xmin = min(lims['left'], xmin)
-            xmax = max(lims['right'], xmax)
-            ymin = min(lims['bottom'], ymin)
-            ymax = max(lims['top'], ymax)
-        self.xmin = xmin
-        self.xmax = xmax
-        self.ymin = ymin
-        self.ymax = ymax
-
-        self._background_mesh.geometry = p3.BoxGeometry(
-            width=1.1 * (self.xmax - self.xmin),
-            height=1.1 * (self.ymax - self.ymin),
-            widthSegments=1,
-            heightSegments=1)
-        self._background_mesh.position = [
-            0.5 * (self.xmin + self.xmax), 0.5 * (self.ymin + self.ymax),
-            self._background_mesh.position[-1]
+            artist._rescale()
+
+    def _background_transform(self):
+        """
+        Position and scale of the background plane, covering the data limits with
+        some margin.
+        """
+        return {
+            'position':
+            (0.5 * (self.xmin + self.xmax), 0.5 * (self.ymin + self.ymax), -200),
+            'scale': (1.1 * (self.xmax - self.xmin), 1.1 * (self.ymax - self.ymin), 1)
+        }
+
+    def _invalidate_bounds(self):
+        self._data_bounds = None
+
+    @contextmanager
+    def defer_autoscale(self):
+        """
+        Context manager that holds autoscaling and the insertion of artists into the
+        scene until exit. Plotting many artists inside the context then costs a
+        single scene update, bounds merge, background update and tick render.
+
+        Examples
+        --------
+
+          with ax.defer_autoscale():
+              for y in spectra:
+                  ax.plot(x, y)
+        """
+        self._autoscale_hold += 1
+        try:
+            yield self
+        finally:
+            self._autoscale_hold -= 1
+            if not self._autoscale_hold:
+                if self._pending_objects:
+                    objects, self._pending_objects = self._pending_objects, []
+                    self.scene.add(objects)
+                if self._autoscale_pending:
+                    self._autoscale_pending = False
+                    self.autoscale()
+
+    def _held_widgets(self):
+        """
+        The widgets whose changes are coalesced during :meth:`Figure.batch_update`.
+        """
+        widgets = [
+            self.camera, self.scene, self._background_mesh, self.layout,
+            self._leftspine, self._bottomspine, self._title, self._xlabel, self._ylabel
         ]
-        self.reset()
+        return [widget for widget in widgets if widget is not None]
 
     def add_artist(self, artist):
-        self._artists.append(artist)
-        self.scene.add(artist.get())
+        self.add_artists([artist])
+
+    def add_artists(self, artists):
+        """
+        Add several artists at once. Their limits are merged in a single pass and
+        the scene is updated with one message.
+
+        Parameters
+        ----------
+        artists:
+            The list of artists to add.
+        """
+        artists = list(artists)
+        for artist in artists:
+            artist._check_scale(self._xscale)
+            artist._check_scale(self._yscale)
+        for artist in artists:
+            artist.set_axes(self)
+            if not (self._xscale.linear and self._yscale.linear):
+                artist._rescale()
+        self._artists.extend(artists)
+        if self._data_bounds is not None:
+            self._data_bounds = _merge_bboxes([self._data_bounds] +
+                                              [artist.get_bbox() for artist in artists])
+        objects = [artist.get() for artist in artists]
+        if self._autoscale_hold:
+            self._pending_objects.extend(objects)
+        else:
+            self.scene.add(objects)
+
+    def _remove_artist(self, artist):
+        self._artists.remove(artist)
+        for group in (self._lines, self._collections):
+            if artist in group:
+                group.remove(artist)
+        obj = artist.get()
+        if obj in self._pending_objects:
+            self._pending_objects.remove(obj)
+        else:
+            self.scene.remove(obj)
+        self._invalidate_bounds()
 
     def get_figure(self):
         return self._fig
 
     def _make_xticks(self, left, right) -> str:
         """
-        Create tick labels on outline edges
+        Create tick labels on outline edges. The html is only rebuilt when the range
+        or the width of the axes has changed. The labels of a spine are a single
+        html value (linked in the frontend between shared axes), so a change sends
+        all of them, and only an identical string is not resent.
         """
-        ticker_ = ticker.AutoLocator()
-        ticks = ticker_.tick_values(left, right)
-        string = '<div style=\"position: relative; height: 30px;\">'
-        precision = max(-round(np.log10(right - left)) + 1, 0)
-        for tick in ticks:
+        key = (left, right, self.width, self._xscale)
+        if key == self._xticks[0]:
+            return self._xticks[1]
+        string = TICK_STYLE + '<div style=\"position:relative;height:30px;\">'
+        for tick, label in locate_ticks(left, right, tick_bins(self.width, 40),
+                                        self._xscale):
             if left + 0.01 * (right - left) <= tick <= right:
                 x = (tick - left) / (right - left) * self.width - 5
-                string += (f'<div style=\"position: absolute; left: {x}px; top: 4px;\">'
-                           f'{value_to_string(tick, precision=precision)}</div>')
-                string += (f'<div style=\"position: absolute; left: {x}px;top: -6px\">'
-                           '&#9589;</div>')
+                string += (f'<div class=\"mpgl-xl\" style=\"left:{x:.1f}px\">'
+                           f'{label}</div><div class=\"mpgl-xm\" '
+                           f'style=\"left:{x:.1f}px\">&#9589;</div>')
         string += '</div>'
+        self._xticks = (key, string)
         return string
 
     def _make_yticks(self, bottom, top) -> str:
         """
-        Create tick labels on outline edges
+        Create tick labels on outline edges. The html is only rebuilt when the range
+        or the height of the axes has changed.
         """
-        ticker_ = ticker.AutoLocator()
-        ticks = ticker_.tick_values(bottom, top)
-        string = ('<div style=\"position: relative;width: 80px;height: '
-                  f'{self.height - 10}px;\">')
-        precision = max(-round(np.log10(top - bottom)) + 1, 0)
-        for tick in ticks:
+        key = (bottom, top, self.height, self._yscale)
+        if key == self._yticks[0]:
+            return self._yticks[1]
+        string = (TICK_STYLE + '<div style=\"position:relative;width:80px;'
+                  f'height:{self.height - 10}px;\">')
+        for tick, label in locate_ticks(bottom, top, tick_bins(self.height, 27),
+                                        self._yscale):
             if bottom <= tick <= top - 0.01 * (top - bottom):
                 y = self.height - ((tick - bottom) / (top - bottom) * self.height) - 15
-                string += (
-                    f'<div style=\"position: absolute; top: {y}px; right: 1px;\">'
-                    f'{value_to_string(tick, precision=precision)} &#8211;</div>')
+                string += (f'<div class=\"mpgl-yl\" style=\"top:{y:.1f}px\">'
+                           f'{label} &#8211;</div>')
         string += '</div>'
+        self._yticks = (key, string)
         return string
 
+    def _visible_box(self):
+        """
+        The currently visible range, including any pan applied in the frontend.
+        """
+        x0, y0, _ = self.camera.position
+        return [
+            self.camera.left + x0, self.camera.right + x0, self.camera.bottom + y0,
+            self.camera.top + y0
+        ]
+
+    def _set_camera_box(self, box):
+        """
+        Show the range ``box``. The camera is moved to the centre of the range, so
+        that the projection bounds stay small and the float32 matrices computed on
+        the GPU do not lose precision for data far from the origin.
+        """
+        x0 = _camera_origin(self._sharex, box[0], box[1])
+        y0 = _camera_origin(self._sharey, box[2], box[3])
+        self._camera_position = (x0, y0, self.camera.position[2])
+        with self.camera.hold_sync():
+            self.camera.position = self._camera_position
+            self.camera.left = box[0] - x0
+            self.camera.right = box[1] - x0
+            self.camera.bottom = box[2] - y0
+            self.camera.top = box[3] - y0
+        self.controls.target = (x0, y0, self.controls.target[2])
+
+    def _on_camera_move(self, *ignored):
+        if tuple(self.camera.position) == self._camera_position:
+            return
+        box = self._visible_box()
+        if box == self._view_box:
+            return
+        if self._sharex is not None or self._sharey is not None:
+            # Move the camera back to the group origin, with bounds showing the
+            # panned range, which the links then give to the other axes
+            self.zoom(box)
+        else:
+            self._request_ticks(box)
+            self._apply_zoom(box)
+
     def zoom(self, box):
         self._zoom_xmin = box[0]
         self._zoom_xmax = box[1]
         self._zoom_ymin = box[2]
         self._zoom_ymax = box[3]
-        self.camera.left = self._zoom_xmin
-        self.camera.right = self._zoom_xmax
-        self.camera.bottom = self._zoom_ymin
-        self.camera.top = self._zoom_ymax
-        self._bottomspine.value = self._make_xticks(left=self._zoom_xmin,
-                                                    right=self._zoom_xmax)
-        self._leftspine.value = self._make_yticks(bottom=self._zoom_ymin,
-                                                  top=self._zoom_ymax)
-
-    def _apply_zoom(self):
+        self._set_camera_box(box)
+        self._request_ticks(box)
+        self._apply_zoom(box)
+        self._follow_shared(box)
+
+    def _follow_shared(self, box):
+        """
+        Update the axes sharing a range with this one after a zoom. Their camera
+        bounds and tick labels are updated in the frontend through the links: only
+        the Python state is changed here, and the artists are given the new range.
+        """
+        xaxes = self._shared_axes(self._sharex)
+        yaxes = self._shared_axes(self._sharey)
+        for ax in dict.fromkeys(xaxes + yaxes):
+            if ax is self:
+                continue
+            new = list(ax._view_box or ax._visible_box())
+            bounds = {}
+            x0, y0, _ = ax.camera.position
+            if ax in xaxes:
+                new[:2] = box[:2]
+                bounds.update(left=box[0] - x0, right=box[1] - x0)
+            if ax in yaxes:
+                new[2:] = box[2:]
+                bounds.update(bottom=box[2] - y0, top=box[3] - y0)
+            _mirror(ax.camera, **bounds)
+            ax._apply_zoom(new)
+
+    def _apply_zoom(self, box):
+        self._view_box = list(box)
         for artist in self._artists:
-            artist._apply_transform()
+            artist._apply_zoom(box)
 
     def reset(self):
-        self.camera.left = self.xmin
-        self.camera.right = self.xmax
-        self.camera.bottom = self.ymin
-        self.camera.top = self.ymax
+        box = [self.xmin, self.xmax, self.ymin, self.ymax]
+        self._set_camera_box(box)
         self._update_ticks_and_layout()
+        self._apply_zoom(box)
+
+    def _compute_ticks(self, box):
+        return (self._make_xticks(left=box[0], right=box[1]),
+                self._make_yticks(bottom=box[2], top=box[3]))
+
+    def _set_ticks(self, ticks):
+        self._bottomspine.value, self._leftspine.value = ticks
+        # The linked tick labels of shared axes are copied in the frontend
+        for group, spine, value in ((self._sharex, '_bottomspine', ticks[0]),
+                                    (self._sharey, '_leftspine', ticks[1])):
+            for ax in self._shared_axes(group):
+                if ax is not self:
+                    _mirror(getattr(ax, spine), value=value)
+
+    def _request_ticks(self, box):
+        """
+        Update the tick labels for the range ``box`` in the figure's thread pool,
+        see :class:`ViewExecutor`.
+        """
+        if self._fig is None:
+            self._update_ticks(box)
+        else:
+            self._fig._submit_view((self, 'ticks'), lambda: self._compute_ticks(box),
+                                   self._set_ticks)
+
+    def _update_ticks(self, box):
+        if self._fig is not None:
+            # Superseded by this synchronous update
+            self._fig._cancel_view((self, 'ticks'))
+        self._set_ticks(self._compute_ticks(box))
 
     def _update_ticks_and_layout(self):
-        self._bottomspine.value = self._make_xticks(left=self.xmin, right=self.xmax)
-        self._leftspine.value = self._make_yticks(bottom=self.ymin, top=self.ymax)
+        self._update_ticks([self.xmin, self.xmax, self.ymin, self.ymax])
         self._update_layout()
 
+    def _html(self, name):
+        """
+        Return the label or spine widget with the given attribute name, making it
+        and adding it to the grid on first use.
+        """
+        widget = getattr(self, name)
+        if widget is None:
+            widget = ipw.HTML(layout={'grid_area': name[1:]})
+            widget._raw_string = ''
+            setattr(self, name, widget)
+            self.children += (widget, )
+        return widget
+
+    def _text(self, name):
+        """
+        The html of a label or spine, empty if its widget has not been made.
+        """
+        widget = getattr(self, name)
+        return '' if widget is None else widget.value
+
     def _update_layout(self):
+        title, topspine, ylabel, leftspine, rightspine, bottomspine, xlabel = (
+            self._text(name)
+            for name in ('_title', '_topspine', '_ylabel', '_leftspine', '_rightspine',
+                         '_bottomspine', '_xlabel'))
         areas = ''
         columns = ''
         rows = ''
-        if self._title.value:
-            areas += (f'\"{"." if self._ylabel.value else ""} '
-                      f'{"." if self._leftspine.value else ""} title .\"\n')
+        if title:
+            areas += (f'\"{"." if ylabel else ""} '
+                      f'{"." if leftspine else ""} title .\"\n')
             rows += '30px '
-        if self._topspine.value:
-            areas += (f'\"{"." if self._ylabel.value else ""} '
-                      f'{"." if self._leftspine.value else ""} '
+        if topspine:
+            areas += (f'\"{"." if ylabel else ""} '
+                      f'{"." if leftspine else ""} '
                       'topspine topspine\"\n')
             rows += '35px '
-        areas += (f'\"{"ylabel" if self._ylabel.value else ""} '
-                  f'{"leftspine" if self._leftspine.value else ""} renderer '
-                  f'{"rightspine" if self._rightspine.value else "."}\"\n')
+        areas += (f'\"{"ylabel" if ylabel else ""} '
+                  f'{"leftspine" if leftspine else ""} renderer '
+                  f'{"rightspine" if rightspine else "."}\"\n')
         rows += f'{self.height}px '
-        if self._bottomspine.value:
-            areas += (f'\"{"." if self._ylabel.value else ""} '
-                      f'{"leftspine" if self._leftspine.value else ""} '
+        if bottomspine:
+            areas += (f'\"{"." if ylabel else ""} '
+                      f'{"leftspine" if leftspine else ""} '
                       'bottomspine bottomspine\"\n')
             rows += '35px '
-        if self._xlabel.value:
-            areas += (f'\"{"." if self._ylabel.value else ""} '
-                      f'{"." if self._leftspine.value else ""} '
-                      f'xlabel {"rightspine" if self._rightspine.value else "."}\"')
+        if xlabel:
+            areas += (f'\"{"." if ylabel else ""} '
+                      f'{"." if leftspine else ""} '
+                      f'xlabel {"rightspine" if rightspine else "."}\"')
             rows += '30px'
 
-        columns = (f'{"30px" if self._ylabel.value else ""} '
-                   f'{"80px" if self._leftspine.value else ""} '
+        columns = (f'{"30px" if ylabel else ""} '
+                   f'{"80px" if leftspine else ""} '
                    f'{self.width}px 35px')
 
         self.layout.grid_template_columns = columns
@@ -293,52 +844,55 @@ class Axes(ipw.GridBox):
 
     def set_xlabel(self, label, fontsize='1.3em'):
         if label:
-            self._xlabel.value = (
+            self._html('_xlabel').value = (
                 '<div style=\"position:relative; '
                 f'width: {self.width}px; height: 30px;\">'
                 '<div style=\"position:relative; top: 50%;left: 50%; '
                 f'transform: translate(-50%, -50%); font-size: {fontsize};'
                 f'float:left;\">{label.replace(" ", "&nbsp;")}</div></div>')
-        else:
+        elif self._xlabel is not None:
             self._xlabel.value = ''
-        self._xlabel._raw_string = label
+        if self._xlabel is not None:
+            self._xlabel._raw_string = label
         self._update_layout()
 
     def get_xlabel(self):
-        return self._xlabel._raw_string
+        return '' if self._xlabel is None else self._xlabel._raw_string
 
     def set_ylabel(self, label, fontsize='1.3em'):
         if label:
-            self._ylabel.value = (
+            self._html('_ylabel').value = (
                 '<div style=\"position:relative; '
                 f'width: 30px; height: {self.height}px;\">'
                 '<div style=\"position:relative; top: 50%;left: 50%; '
                 'transform: translate(-50%, -50%) rotate(-90deg); '
                 f'font-size: {fontsize};'
                 f'float:left;\">{label.replace(" ", "&nbsp;")}</div></div>')
-        else:
+        elif self._ylabel is not None:
             self._ylabel.value = ''
-        self._ylabel._raw_string = label
+        if self._ylabel is not None:
+            self._ylabel._raw_string = label
         self._update_layout()
 
     def get_ylabel(self):
-        return self._ylabel._raw_string
+        return '' if self._ylabel is None else self._ylabel._raw_string
 
     def set_title(self, title, fontsize='1.3em'):
         if title:
-            self._title.value = (
+            self._html('_title').value = (
                 '<div style=\"position:relative; '
                 f'width: {self.width}px; height: 30px;\">'
                 '<div style=\"position:relative; top: 50%;left: 50%; '
                 f'transform: translate(-50%, -50%); font-size: {fontsize};'
                 f'float:left;\">{title.replace(" ", "&nbsp;")}</div></div>')
-        else:
+        elif self._title is not None:
             self._title.value = ''
-        self._title._raw_string = title
+        if self._title is not None:
+            self._title._raw_string = title
         self._update_layout()
 
     def get_title(self):
-        return self._title._raw_string
+        return '' if self._title is None else self._title._raw_string
 
     def plot(self, *args, color=None, **kwargs):
         from .plot import plot as p
@@ -348,6 +902,26 @@ class Axes(ipw.GridBox):
         self._lines.append(line)
         return line
 
+    def plot_many(self, x, y, **kwargs):
+        """
+        Plot many lines sharing the same x coordinates as a single
+        :class:`LineCollection`, which is much faster than calling :meth:`plot` for
+        each line.
+
+        Parameters
+        ----------
+        x:
+            The x coordinates, shared by all the lines, or a 2D array like ``y``.
+        y:
+            The y coordinates, as a 2D array with one line per row.
+        **kwargs:
+            Forwarded to :class:`LineCollection`.
+        """
+        from .plot import plot_many as pm
+        coll = pm(self, x, y, **kwargs)
+        self._collections.append(coll)
+        return coll
+
     def scatter(self, *args, color=None, **kwargs):
         from .scatter import scatter as s
         if color is None:
@@ -359,3 +933,39 @@ class Axes(ipw.GridBox):
     def imshow(self, *args, **kwargs):
         from .imshow import imshow as im
         return im(self, *args, **kwargs)
+
+
+def _camera_origin(group, low, high):
+    """
+    The camera position along one dimension: the centre of the range, or the
+    common origin of the axes sharing that range.
+    """
+    if group is None:
+        return 0.5 * (low + high)
+    if group.origin is None:
+        group.origin = 0.5 * (low + high)
+    return group.origin
+
+
+def _mirror(widget, **values):
+    """
+    Set trait values which the frontend has already received through a link,
+    without sending them again.
+    """
+    with widget._lock_property(**values):
+        for key, value in values.items():
+            setattr(widget, key, value)
+
+
+def _merge_bboxes(bboxes):
+    """
+    Combine a list of bounding boxes into one box enclosing all of them. Artists
+    without data have no bounding box (``None``), and are skipped.
+    """
+    bboxes = [b for b in bboxes if b is not None]
+    return {
+        'left': min([b['left'] for b in bboxes], default=np.inf),
+        'right': max([b['right'] for b in bboxes], default=-np.inf),
+        'bottom': min([b['bottom'] for b in bboxes], default=np.inf),
+        'top': max([b['top'] for b in bboxes], default=-np.inf)
+    }
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+
+class WidgetCache:
+    """
+    Keyed, reference-counted store of widgets shared between artists, such as the
+    materials of lines with the same colour and width, or the unit plane under
+    every image and axes background. A widget is keyed on its class and
+    constructor arguments, made on first request, and closed once all the artists
+    using it have released it.
+
+    Shared widgets must not be modified after creation.
+    """
+
+    def __init__(self):
+        # key -> [widget, reference count]
+        self._entries = {}
+        self._keys = {}
+
+    def get(self, cls, **kwargs):
+        """
+        Return the widget made by ``cls(**kwargs)``, reusing an existing one if
+        possible. The keyword arguments must be hashable.
+        """
+        key = (cls, tuple(sorted(kwargs.items())))
+        entry = self._entries.get(key)
+        # The widget may have been closed externally (e.g. Widget.close_all)
+        if entry is None or entry[0].comm is None:
+            entry = [cls(**kwargs), 0]
+            self._entries[key] = entry
+            self._keys[id(entry[0])] = key
+        entry[1] += 1
+        return entry[0]
+
+    def release(self, widget):
+        """
+        Drop a reference to a widget obtained with :meth:`get`, closing it when it is
+        no longer used. Widgets which are not in the cache are ignored.
+        """
+        key = self._keys.get(id(widget))
+        if key is None or self._entries[key][0] is not widget:
+            return
+        entry = self._entries[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._entries[key]
+            del self._keys[id(widget)]
+            widget.close()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_CACHE = WidgetCache()
+
+
+def shared(cls, **kwargs):
+    """
+    Get a widget from the global cache, see :meth:`WidgetCache.get`.
+    """
+    return _CACHE.get(cls, **kwargs)
+
+
+def release(*widgets):
+    """
+    Release widgets obtained with :func:`shared`. ``None`` values are ignored.
+    """
+    for widget in widgets:
+        if widget is not None:
+            _CACHE.release(widget)
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+import numpy as np
+
+
+def minmax_indices(x, y, left: float, right: float, ncols: int) -> np.ndarray:
+    """
+    Select the samples needed to draw a line with ``ncols`` pixel columns between
+    ``left`` and ``right``, keeping the first, last, minimum and maximum sample in
+    each column (M4 decimation). The rendered line is identical to the one drawn
+    from the full data, but the number of returned samples is at most ``4 * ncols``
+    (plus one sample either side of the range so the line reaches the edges).
+
+    Parameters
+    ----------
+    x:
+        The x coordinates, sorted in ascending order.
+    y:
+        The y coordinates.
+    left:
+        The lower bound of the range to decimate.
+    right:
+        The upper bound of the range to decimate.
+    ncols:
+        The number of pixel columns spanned by the range.
+    """
+    start = max(np.searchsorted(x, left, side='left') - 1, 0)
+    end = min(np.searchsorted(x, right, side='right') + 1, len(x))
+    if (end - start <= 4 * ncols) or (right <= left):
+        return np.arange(start, end)
+
+    xs = x[start:end]
+    ys = y[start:end]
+    cols = ((xs - left) * (ncols / (right - left))).astype(np.int64)
+    np.clip(cols, -1, ncols, out=cols)
+
+    # x is sorted, so each column is a contiguous run of samples
+    firsts = np.flatnonzero(np.diff(cols, prepend=cols[0] - 1))
+    lasts = np.append(firsts[1:], len(cols)) - 1
+    seg = np.repeat(np.arange(len(firsts)), lasts - firsts + 1)
+
+    ylow = ys
+    yhigh = ys
+    if np.isnan(ys).any():
+        ylow = np.where(np.isnan(ys), np.inf, ys)
+        yhigh = np.where(np.isnan(ys), -np.inf, ys)
+    imin = _first_hit(ylow == np.minimum.reduceat(ylow, firsts)[seg], seg)
+    imax = _first_hit(yhigh == np.maximum.reduceat(yhigh, firsts)[seg], seg)
+
+    ind = np.sort(np.stack([firsts, imin, imax, lasts], axis=1), axis=1).ravel()
+    ind = ind[np.diff(ind, prepend=-1) != 0]
+    return ind + start
+
+
+def _first_hit(mask: np.ndarray, seg: np.ndarray) -> np.ndarray:
+    """
+    Return the index of the first ``True`` value in ``mask`` for each segment.
+    """
+    hits = np.flatnonzero(mask)
+    return hits[np.diff(seg[hits], prepend=-1) != 0]
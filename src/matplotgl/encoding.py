@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+import numpy as np
+
+
+def _center(values):
+    """
+    Return the centre and half-width of the range of the values. For integers, the
+    centre is computed exactly as an int64, so that subtracting it from large values
+    (e.g. epoch-nanosecond timestamps) does not lose precision. The range is
+    computed with Python integers, which cannot overflow.
+    """
+    if values.dtype.kind in 'iu':
+        vmin = int(values.min())
+        vmax = int(values.max())
+        origin = np.int64(vmin + (vmax - vmin) // 2)
+    else:
+        vmin = np.nanmin(values)
+        vmax = np.nanmax(values)
+        origin = 0.5 * (vmin + vmax)
+    half = 0.5 * float(vmax - vmin)
+    return origin, (half if half > 0 else 1.0)
+
+
+def unpack(x, y=None):
+    """
+    Split the coordinates given to an artist into x and y arrays, without copying.
+    If ``y`` is ``None``, ``x`` is an (N, 2) or (N, 3) array of vertices, and the x
+    and y arrays are views of its first two columns.
+
+    Returns ``(packed, x, y)``, where ``packed`` is the vertex array if it can be
+    sent to the frontend as is (C-contiguous float32), and ``None`` otherwise.
+
+    Parameters
+    ----------
+    x:
+        The x coordinates, or the (N, 2) or (N, 3) array of vertices.
+    y:
+        The y coordinates, or ``None``.
+    """
+    if y is not None:
+        return None, np.asarray(x), np.asarray(y)
+    xy = np.asarray(x)
+    if xy.ndim != 2 or xy.shape[1] not in (2, 3):
+        raise ValueError('Expected an array of vertices of shape (N, 2) or (N, 3), '
+                         f'got {xy.shape}.')
+    packed = xy if (xy.dtype == np.float32 and xy.flags.c_contiguous) else None
+    return packed, xy[:, 0], xy[:, 1]
+
+
+def encode_positions(x, y, quantize=False, packed=None):
+    """
+    Encode 2D vertex positions relative to the centre of their range, scaled to
+    ``[-1, 1]``. The inverse transform is applied on the GPU through the position and
+    scale of the threejs object, so large coordinates keep full float32 precision
+    relative to the data span, and the constant z coordinate is not sent (WebGL
+    fills in a zero for a two-component position attribute).
+
+    With ``quantize=True``, the positions are stored as int16 in a normalized buffer
+    attribute, which the GPU converts back to ``[-1, 1]`` when reading the vertex.
+    NaNs cannot be represented and are mapped to the centre of the range.
+
+    If the vertices were given as a float32 array (see :func:`unpack`), they are
+    sent as they are, without encoding or copying.
+
+    Returns the encoded (N, 2) array (float32 or int16), and the ``origin`` and
+    ``scale`` of the transform back to data coordinates.
+
+    Parameters
+    ----------
+    x:
+        The x coordinates.
+    y:
+        The y coordinates.
+    quantize:
+        If ``True``, encode the positions as 16-bit integers.
+    packed:
+        The float32 array of vertices ``x`` and ``y`` are views of, if any.
+    """
+    if packed is not None and not quantize:
+        return packed, (0.0, 0.0), (1.0, 1.0)
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) == 0:
+        empty = np.zeros((0, 2), dtype='int16' if quantize else 'float32')
+        return empty, (0.0, 0.0), (1.0, 1.0)
+    ox, sx = _center(x)
+    oy, sy = _center(y)
+    out = np.empty((len(x), 2), dtype='float32')
+    for col, values, origin, scale in ((0, x, ox, sx), (1, y, oy, sy)):
+        # Subtract in the input precision (integers in int64, so that unsigned and
+        # small types do not wrap around), but write the float32 result directly
+        # into the output, so that no full-size temporary is allocated
+        np.subtract(values,
+                    origin,
+                    out=out[:, col],
+                    dtype=np.int64 if values.dtype.kind in 'iu' else None,
+                    casting='unsafe')
+        out[:, col] *= np.float32(1 / scale)
+    if quantize:
+        out *= 32767
+        np.nan_to_num(out, copy=False, nan=0.0)
+        out = np.rint(out, out=out).astype('int16')
+    return out, (float(ox), float(oy)), (sx, sy)
+
+
+def encode_frames(frames, quantize=False):
+    """
+    Encode the vertices of several animation frames into one contiguous buffer,
+    with a single transform for all of them (see :func:`encode_positions`).
+
+    Returns the list of views of the buffer holding each frame, and the ``origin``
+    and ``scale`` of the transform.
+
+    Parameters
+    ----------
+    frames:
+        The ``(x, y)`` coordinates of each frame. Frames may have different lengths.
+    quantize:
+        If ``True``, encode the positions as 16-bit integers.
+    """
+    out, origin, scale = encode_positions(np.concatenate([x for x, _ in frames]),
+                                          np.concatenate([y for _, y in frames]),
+                                          quantize=quantize)
+    bounds = np.cumsum([0] + [len(x) for x, _ in frames])
+    return [out[start:end]
+            for start, end in zip(bounds[:-1], bounds[1:])], origin, scale
+
+
+def set_transform(obj, origin, scale, z):
+    """
+    Apply the transform returned by :func:`encode_positions` to a threejs object,
+    placing it at depth ``z``.
+
+    Note that objects drawing encoded positions should be created with
+    ``frustumCulled=False``, as threejs cannot compute the bounding sphere of a
+    two-component position attribute.
+    """
+    with obj.hold_sync():
+        for key, value in transform_traits(origin, scale, z).items():
+            setattr(obj, key, value)
+
+
+def transform_traits(origin, scale, z):
+    """
+    The ``position`` and ``scale`` traits of an object drawing positions encoded by
+    :func:`encode_positions`.
+    """
+    return {'position': (origin[0], origin[1], z), 'scale': (scale[0], scale[1], 1)}
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import weakref
+
+# Upper bound on the threads of each figure: the work is mostly numpy, which releases
+# the GIL, but more threads than this only compete for memory bandwidth
+_MAX_WORKERS = 4
+
+
+class ViewExecutor:
+    """
+    Run the view-dependent recomputations of a figure (ticks, line decimation,
+    density histograms, image tiles) in a thread pool, so that zooming and panning
+    do not block the kernel.
+
+    Each task has a key (typically the artist it updates). Submitting a task
+    supersedes the pending task with the same key: it is cancelled if it has not
+    started, and its result is discarded otherwise. Results are applied on the
+    event loop the task was submitted from, which is the only place widgets are
+    modified. Without a running event loop (e.g. in a script), tasks run
+    immediately.
+
+    Parameters
+    ----------
+    max_workers:
+        The number of threads.
+    """
+
+    def __init__(self, max_workers=_MAX_WORKERS):
+        self._max_workers = max_workers
+        self._pool = None
+        # key -> (generation, future, apply)
+        self._tasks = {}
+        self._generation = 0
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers,
+                                            thread_name_prefix='matplotgl')
+            # Stop the threads when the figure is garbage collected
+            weakref.finalize(self, self._pool.shutdown, wait=False)
+        return self._pool
+
+    def submit(self, key, compute, apply, wait=False):
+        """
+        Run ``compute()`` in the thread pool, then ``apply(result)`` on the event
+        loop, unless a newer task with the same key has been submitted meanwhile.
+
+        Parameters
+        ----------
+        key:
+            The key of the task. Only the latest task of each key is applied.
+        compute:
+            The function doing the work. It must not modify any widget.
+        apply:
+            The function sending the result to the frontend.
+        wait:
+            If ``True``, run the task immediately in the calling thread.
+        """
+        self.cancel(key)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if wait or loop is None:
+            apply(compute())
+            return
+        self._generation += 1
+        generation = self._generation
+        future = self._get_pool().submit(compute)
+        self._tasks[key] = (generation, future, apply)
+        future.add_done_callback(
+            lambda f: loop.call_soon_threadsafe(self._finish, key, generation, f))
+
+    def _finish(self, key, generation, future):
+        current = self._tasks.get(key)
+        if current is None or current[0] != generation:
+            return
+        del self._tasks[key]
+        if not future.cancelled():
+            current[2](future.result())
+
+    def cancel(self, key):
+        """
+        Cancel the pending task with the given key, if any. This is used when the
+        state the task was computing from is replaced synchronously.
+        """
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            task[1].cancel()
+
+    def pending(self):
+        """
+        Return the number of tasks whose result has not been applied yet.
+        """
+        return len(self._tasks)
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+from base64 import standard_b64encode
+import hashlib
+import io
+import json
+
+from ipywidgets.embed import (_find_widget_refs_by_state, add_resolved_links,
+                              embed_minimal_html)
+from ipywidgets.widgets.widget import _remove_buffers
+
+
+def _embed_state(widget, overrides):
+    """
+    Make the embedded state of a widget, replacing some of its trait values. The
+    original values of the replaced traits are never serialized.
+    """
+    keys = [key for key in widget.keys if key not in overrides]
+    state = widget.get_state(key=keys, drop_defaults=True)
+    for key, value in overrides.items():
+        to_json = widget.trait_metadata(key, 'to_json', widget._trait_to_json)
+        state[key] = to_json(value, widget)
+    model_state, buffer_paths, buffers = _remove_buffers(state)
+    out = {
+        'model_name': widget._model_name,
+        'model_module': widget._model_module,
+        'model_module_version': widget._model_module_version,
+        'state': model_state
+    }
+    if buffers:
+        out['buffers'] = [{
+            'encoding': 'base64',
+            'path': path,
+            'data': standard_b64encode(data).decode('ascii')
+        } for path, data in zip(buffer_paths, buffers)]
+    return out
+
+
+def _collect_state(widget, store, overrides):
+    """
+    Gather the embedded state of a widget and of all the widgets it refers to.
+    """
+    state = _embed_state(widget, overrides.get(widget, {}))
+    store[widget.model_id] = state
+    for ref in _find_widget_refs_by_state(widget, state['state']):
+        if ref.model_id not in store:
+            _collect_state(ref, store, overrides)
+
+
+def _replace_refs(value, replacements):
+    if isinstance(value, str):
+        return replacements.get(value, value)
+    if isinstance(value, list):
+        return [_replace_refs(v, replacements) for v in value]
+    if isinstance(value, dict):
+        return {k: _replace_refs(v, replacements) for k, v in value.items()}
+    return value
+
+
+def _deduplicate(store):
+    """
+    Merge the data models (buffer attributes, textures) holding identical buffers,
+    pointing all the references to a single copy. Returns the number of bytes
+    saved.
+    """
+    first = {}
+    replacements = {}
+    saved = 0
+    for model_id, state in store.items():
+        if 'buffers' not in state:
+            continue
+        digest = hashlib.sha1(
+            json.dumps([state['model_name'], state['state']], sort_keys=True).encode())
+        for buffer in state['buffers']:
+            digest.update(json.dumps(buffer['path']).encode())
+            digest.update(buffer['data'].encode())
+        digest = digest.hexdigest()
+        if digest in first:
+            replacements['IPY_MODEL_' + model_id] = 'IPY_MODEL_' + first[digest]
+            saved += sum(len(b['data']) for b in state['buffers'])
+        else:
+            first[digest] = model_id
+    for ref in replacements:
+        del store[ref[len('IPY_MODEL_'):]]
+    for state in store.values():
+        state['state'] = _replace_refs(state['state'], replacements)
+    return saved
+
+
+def save_html(fig, path, title='Matplotgl figure', quantize=False, max_points=None):
+    """
+    Write a figure to a standalone html page, which can be viewed without a kernel.
+
+    Identical binary buffers are only stored once. Large artists can be reduced to
+    make the page smaller and faster to load, without changing the live figure:
+    positions can be quantized to 16-bit integers, and lines and points with more
+    than ``max_points`` vertices are decimated.
+
+    Returns a report of the sizes (in bytes) of the page, of the embedded buffers,
+    and of the duplicated buffers which were removed.
+
+    Parameters
+    ----------
+    fig:
+        The figure to save.
+    path:
+        The file name, or a file-like object.
+    title:
+        The title of the page.
+    quantize:
+        If ``True``, reduce the precision of positions.
+    max_points:
+        The maximum number of vertices kept for each line or set of points.
+    """
+    overrides = {}
+    for ax in fig.axes:
+        for artist in ax._artists:
+            overrides.update(artist._export_overrides(quantize, max_points))
+    store = {}
+    _collect_state(fig, store, overrides)
+    add_resolved_links(store, drop_defaults=True)
+    deduplicated = _deduplicate(store)
+    buffers = sum(
+        len(b['data']) for state in store.values() for b in state.get('buffers', []))
+    html = io.StringIO()
+    embed_minimal_html(html, views=[fig], title=title, state=store)
+    html = html.getvalue()
+    if hasattr(path, 'write'):
+        path.write(html)
+    else:
+        with open(path, 'w') as f:
+            f.write(html)
+    return {
+        'total': len(html.encode()),
+        'buffers': buffers,
+        'deduplicated': deduplicated,
+        'widgets': len(store)
+    }
@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
 
+from contextlib import ExitStack, contextmanager
+
+from .executor import ViewExecutor
 from .toolbar import Toolbar
 from .widgets import HBar
 
@@ -13,14 +16,76 @@ class Figure(HBar):
         self._dpi = 96
         self.width = figsize[0] * self._dpi
         self.height = figsize[1] * self._dpi
+        self._batch_depth = 0
+        self._dirty_artists = []
+        self._executor = ViewExecutor()
 
         self.toolbar = Toolbar()
         self.toolbar._home.on_click(self.home)
         self.toolbar._zoom.observe(self.toggle_pickers, names='value')
         self.toolbar._pan.observe(self.toggle_pan, names='value')
+        self.toolbar._hover.observe(self.toggle_hover, names='value')
 
         super().__init__([self.toolbar])
 
+    @contextmanager
+    def batch_update(self):
+        """
+        Context manager that coalesces all the updates made to the figure. Widget
+        traits changed inside the context (camera, ticks, layout) are sent in a
+        single message per widget on exit, artist buffers modified several times
+        are rebuilt and sent only once, and autoscaling runs once per axes.
+
+        Examples
+        --------
+
+          with fig.batch_update():
+              for pts, data in zip(points, new_data):
+                  pts.set_data(data)
+              ax.zoom([0, 10, 0, 1])
+        """
+        self._batch_depth += 1
+        try:
+            with ExitStack() as stack:
+                if self._batch_depth == 1:
+                    # Exit order is reversed: autoscale first, then send the dirty
+                    # artists, and finally release the held widgets.
+                    for ax in self.axes:
+                        for widget in ax._held_widgets():
+                            stack.enter_context(widget.hold_sync())
+                    stack.callback(self._flush)
+                    for ax in self.axes:
+                        stack.enter_context(ax.defer_autoscale())
+                yield self
+        finally:
+            self._batch_depth -= 1
+
+    def _flush(self):
+        """
+        Send the artists modified during a batch update.
+        """
+        artists, self._dirty_artists = self._dirty_artists, []
+        for artist in artists:
+            artist._flush()
+
+    def _submit_view(self, key, compute, apply):
+        """
+        Run view-dependent work in the background, see :class:`ViewExecutor`. Inside
+        a batch update, the work runs immediately so that it is sent with the batch.
+        """
+        self._executor.submit(key, compute, apply, wait=self._batch_depth > 0)
+
+    def _cancel_view(self, key):
+        self._executor.cancel(key)
+
+    def save_html(self, path, **kwargs):
+        """
+        Save the figure to a standalone html page. See :func:`save_html` for the
+        available options.
+        """
+        from .export import save_html
+        return save_html(self, path, **kwargs)
+
     def home(self, *args):
         for ax in self.axes:
             ax.reset()
@@ -28,18 +93,18 @@ class Figure(HBar):
     def toggle_pickers(self, change):
         for ax in self.axes:
             if change['new']:
-                ax._zoom_down_picker.observe(ax.on_mouse_down, names=['point'])
-                ax._zoom_up_picker.observe(ax.on_mouse_up, names=['point'])
-                ax._zoom_move_picker.observe(ax.on_mouse_move, names=['point'])
-                ax.renderer.controls = [
-                    ax.controls, ax._zoom_down_picker, ax._zoom_up_picker,
-                    ax._zoom_move_picker
-                ]
-            else:
+                down, up, move = ax._zoom_tools()
+                down.observe(ax.on_mouse_down, names=['point'])
+                up.observe(ax.on_mouse_up, names=['point'])
+            elif ax._zoom_down_picker is not None:
                 ax._zoom_down_picker.unobserve_all()
                 ax._zoom_up_picker.unobserve_all()
-                ax._zoom_move_picker.unobserve_all()
-                ax.renderer.controls = [ax.controls]
+            ax._zoom_active = change['new']
+            ax._update_controls()
+
+    def toggle_hover(self, change):
+        for ax in self.axes:
+            ax.set_hover(change['new'])
 
     def toggle_pan(self, change):
         for ax in self.axes:
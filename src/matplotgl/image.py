@@ -5,37 +5,260 @@ import pythreejs as p3
 import matplotlib as mpl
 import numpy as np
 
+from .artist import Artist
+from .cache import release, shared
+from .utils import colormap_lut, lut_indices
 
-class Image:
+# Number of pixels colour-mapped at once on the CPU
+_COLOR_CHUNK_SIZE = 1 << 16
 
-    def __init__(self, array, extent=None, cmap='viridis', zorder=0):
+_VERTEX_SHADER = """
+varying vec2 vUv;
 
+void main() {
+    vUv = uv;
+    gl_Position = projectionMatrix * modelViewMatrix * vec4(position, 1.0);
+}
+"""
+
+# Look up the colour of each fragment from the raw data value and a 256-entry
+# colormap texture. Quantized data is stored as 16-bit codes split over the
+# luminance (high byte) and alpha (low byte) channels, with the largest code
+# reserved for NaNs.
+_FRAGMENT_SHADER = """
+uniform sampler2D data;
+uniform sampler2D lut;
+uniform float vmin;
+uniform float vmax;
+uniform float offset;
+uniform float scale;
+varying vec2 vUv;
+
+void main() {
+    vec4 texel = texture2D(data, vUv);
+#ifdef QUANTIZED
+    float code = floor(texel.r * 255.0 + 0.5) * 256.0 + floor(texel.a * 255.0 + 0.5);
+    if (code > 65534.5) discard;
+    float value = offset + scale * code;
+#else
+    float value = texel.r;
+    if (value != value) discard;
+#endif
+    float t = clamp((value - vmin) / (vmax - vmin), 0.0, 1.0);
+    gl_FragColor = vec4(texture2D(lut, vec2((t * 255.0 + 0.5) / 256.0, 0.5)).rgb, 1.0);
+}
+"""
+
+
+class Image(Artist):
+
+    def __init__(self,
+                 array,
+                 extent=None,
+                 cmap='viridis',
+                 vmin=None,
+                 vmax=None,
+                 zorder=0,
+                 shader=False,
+                 quantize=False):
+
+        super().__init__(zorder=zorder)
         self._array = np.asarray(array)
         self._extent = extent if extent is not None else [
             0, array.shape[1], 0, array.shape[0]
         ]
-        self._zorder = zorder
-        self._cmap = mpl.colormaps[cmap]
-        self._texture = p3.DataTexture(
-            data=self._cmap(self._array)[..., :3].astype('float32'),
-            format="RGBFormat",
-            type="FloatType",
-        )
-
-        self._geometry = p3.PlaneGeometry(width=self._extent[1] - self._extent[0],
-                                          height=self._extent[3] - self._extent[2],
-                                          widthSegments=1,
-                                          heightSegments=1)
+        self._cmap = mpl.colormaps[cmap] if isinstance(cmap, str) else cmap
+        self._cmap_lut = colormap_lut(self._cmap)
+        self._vmin = np.nanmin(self._array) if vmin is None else vmin
+        self._vmax = np.nanmax(self._array) if vmax is None else vmax
+        self._shader = shader
+        self._quantize = quantize
+
+        if self._shader:
+            self._texture, decoding = self._make_data_texture(self._array)
+            self._lut = p3.DataTexture(data=self._make_lut(),
+                                       format="RGBAFormat",
+                                       type="UnsignedByteType")
+            uniforms = {
+                'data': self._texture,
+                'lut': self._lut,
+                'vmin': float(self._vmin),
+                'vmax': float(self._vmax),
+                'offset': decoding[0],
+                'scale': decoding[1]
+            }
+            self._material = p3.ShaderMaterial(
+                uniforms={key: dict(value=value)
+                          for key, value in uniforms.items()},
+                defines={'QUANTIZED': ''} if quantize else None,
+                vertexShader=_VERTEX_SHADER,
+                fragmentShader=_FRAGMENT_SHADER)
+        else:
+            # The colour buffer is allocated once, and refilled on every update.
+            # Rows of 3 bytes per pixel are not 4-byte aligned for all widths.
+            self._texture = p3.DataTexture(data=self._make_colors(),
+                                           format="RGBFormat",
+                                           type="UnsignedByteType",
+                                           unpackAlignment=1)
+            self._material = p3.MeshBasicMaterial(map=self._texture)
+
+        # All images share the same unit plane, resized with the mesh scale
+        self._geometry = shared(p3.PlaneGeometry,
+                                width=1,
+                                height=1,
+                                widthSegments=1,
+                                heightSegments=1)
 
         self._image = p3.Mesh(geometry=self._geometry,
-                              material=p3.MeshBasicMaterial(map=self._texture),
+                              material=self._material,
                               position=[
                                   0.5 * (self._extent[0] + self._extent[1]),
                                   0.5 * (self._extent[2] + self._extent[3]),
                                   self._zorder - 50
+                              ],
+                              scale=[
+                                  self._extent[1] - self._extent[0],
+                                  self._extent[3] - self._extent[2], 1
                               ])
 
-    def get_bbox(self):
+    def _make_colors(self, array=None, out=None):
+        """
+        Colormap the data (or the given array) on the CPU into uint8 RGB values, for
+        the non-shader mode, through the 256-entry lookup table of the colormap.
+        The colours are written into ``out`` if given. The pixels are processed in
+        chunks, so that the temporary index arrays stay small.
+        """
+        array = self._array if array is None else array
+        if out is None:
+            out = np.empty(array.shape + (3, ), dtype=np.uint8)
+        lut = self._cmap_lut[:, :3]
+        bad = np.round(np.asarray(self._cmap.get_bad()[:3]) * 255).astype(np.uint8)
+        values = array.reshape(-1)
+        colors = out.reshape(-1, 3)
+        for start in range(0, len(values), _COLOR_CHUNK_SIZE):
+            chunk = values[start:start + _COLOR_CHUNK_SIZE]
+            block = colors[start:start + _COLOR_CHUNK_SIZE]
+            np.take(lut,
+                    lut_indices(chunk, self._vmin, self._vmax),
+                    axis=0,
+                    out=block,
+                    mode='clip')
+            if chunk.dtype.kind == 'f':
+                block[np.isnan(chunk)] = bad
+        return out
+
+    def _make_lut(self):
+        """
+        Shape the colormap lookup table into a (1, 256, 4) uint8 texture.
+        """
+        return self._cmap_lut.reshape(1, 256, 4)
+
+    def _encode_data(self, array, copy=True):
+        """
+        Encode the raw data for the shader, either as float32 or quantized to 16-bit
+        codes. Also return the ``(offset, scale)`` pair needed to decode texel
+        values back to data values in the shader. The float32 buffer is a copy
+        unless ``copy=False``, as it is refilled in place by :meth:`set_data`.
+        """
+        if not self._quantize:
+            return array.astype('float32', copy=copy), (0.0, 1.0)
+        low = float(np.nanmin(array))
+        span = float(np.nanmax(array)) - low
+        scale = span / 65534 if span > 0 else 1.0
+        codes = np.round((array - low) / scale)
+        codes = np.where(np.isnan(codes), 65535, codes).astype(np.uint16)
+        data = np.stack([codes >> 8, codes & 0xFF], axis=-1).astype(np.uint8)
+        return data, (low, scale)
+
+    def _make_data_texture(self, array, copy=True):
+        """
+        Make the texture holding the raw data, see :meth:`_encode_data`.
+        """
+        data, decoding = self._encode_data(array, copy=copy)
+        if self._quantize:
+            # Rows of 2 bytes per pixel are not 4-byte aligned for odd widths
+            texture = p3.DataTexture(data=data,
+                                     format="LuminanceAlphaFormat",
+                                     type="UnsignedByteType",
+                                     unpackAlignment=1)
+        else:
+            texture = p3.DataTexture(data=data,
+                                     format="LuminanceFormat",
+                                     type="FloatType")
+        return texture, decoding
+
+    def _set_uniforms(self, **values):
+        # The uniforms dict must be replaced (not mutated) to be synced
+        uniforms = dict(self._material.uniforms)
+        for key, value in values.items():
+            uniforms[key] = {'value': value}
+        self._material.uniforms = uniforms
+
+    def set_data(self, array):
+        """
+        Replace the image values, keeping the extent and colour limits.
+
+        Parameters
+        ----------
+        array:
+            The new values, with the same shape as the current ones.
+        """
+        array = np.asarray(array)
+        if array.shape != self._array.shape:
+            raise ValueError(f'Expected an array of shape {self._array.shape}, got '
+                             f'{array.shape}.')
+        self._array = array
+        self._request_send('data' if self._shader else 'colors')
+
+    def get_cmap(self):
+        return self._cmap
+
+    def set_cmap(self, cmap):
+        """
+        Set the colormap. In shader mode, only the 256-entry lookup table is resent.
+        """
+        self._cmap = mpl.colormaps[cmap] if isinstance(cmap, str) else cmap
+        self._cmap_lut = colormap_lut(self._cmap)
+        self._request_send('lut' if self._shader else 'colors')
+
+    def get_clim(self):
+        return self._vmin, self._vmax
+
+    def set_clim(self, vmin=None, vmax=None):
+        """
+        Set the limits of the colour scale. In shader mode, this only updates two
+        uniforms.
+        """
+        if vmin is not None:
+            self._vmin = vmin
+        if vmax is not None:
+            self._vmax = vmax
+        self._request_send('clim' if self._shader else 'colors')
+
+    def _send(self, parts):
+        if 'data' in parts:
+            if self._quantize:
+                data, (offset, scale) = self._encode_data(self._array)
+                self._texture.data = data
+                self._set_uniforms(offset=offset, scale=scale)
+            else:
+                np.copyto(self._texture.data, self._array, casting='unsafe')
+                self._texture.send_state('data')
+        if 'colors' in parts:
+            # Refill the texture buffer in place: the same array is resent
+            self._make_colors(out=self._texture.data)
+            self._texture.send_state('data')
+        if 'lut' in parts:
+            self._lut.data = self._make_lut()
+        if 'clim' in parts:
+            self._set_uniforms(vmin=float(self._vmin), vmax=float(self._vmax))
+
+    def _check_scale(self, scale):
+        # The pixels would no longer be evenly spaced
+        if not scale.linear:
+            raise ValueError(f'Images cannot be drawn on {scale.name} axes.')
+
+    def _compute_bbox(self):
         return {
             'left': self._extent[0],
             'right': self._extent[1],
@@ -43,5 +266,60 @@ class Image:
             'top': self._extent[3]
         }
 
+    def _frame_state(self):
+        return np.array(self._array)
+
+    def _set_frame_state(self, state):
+        self.set_data(state)
+
+    def _make_frames(self, states):
+        if self._shader:
+            # One float32 buffer for all frames, unless quantized per frame
+            stack = np.stack(states).astype('float32', copy=False)
+            materials = []
+            for values in stack:
+                texture, (offset, scale) = self._make_data_texture(values, copy=False)
+                uniforms = dict(self._material.uniforms)
+                uniforms.update(data={'value': texture},
+                                offset={'value': offset},
+                                scale={'value': scale})
+                materials.append(
+                    p3.ShaderMaterial(uniforms=uniforms,
+                                      defines=self._material.defines,
+                                      vertexShader=_VERTEX_SHADER,
+                                      fragmentShader=_FRAGMENT_SHADER))
+        else:
+            colors = np.empty((len(states), ) + self._array.shape + (3, ),
+                              dtype=np.uint8)
+            for frame, values in zip(colors, states):
+                self._make_colors(values, out=frame)
+            materials = [
+                p3.MeshBasicMaterial(map=p3.DataTexture(data=frame,
+                                                        format="RGBFormat",
+                                                        type="UnsignedByteType",
+                                                        unpackAlignment=1))
+                for frame in colors
+            ]
+        return [
+            p3.Mesh(geometry=self._geometry,
+                    material=material,
+                    position=self._image.position,
+                    scale=self._image.scale,
+                    visible=False) for material in materials
+        ]
+
+    def _pick(self, x, y, scale, radius):
+        left, right, bottom, top = self._extent
+        ny, nx = self._array.shape[:2]
+        col = int(np.floor((x - left) / (right - left) * nx))
+        row = int(np.floor((y - bottom) / (top - bottom) * ny))
+        if not (0 <= col < nx and 0 <= row < ny):
+            return None
+        # Samples of other artists (e.g. points on top of the image) take priority
+        return radius, {'x': x, 'y': y, 'value': self._array[row, col]}
+
+    def _release(self):
+        release(self._geometry)
+
     def get(self):
         return self._image
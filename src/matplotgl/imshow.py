@@ -1,11 +1,21 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
 
+import numpy as np
+
 from .image import Image
+from .tiledimage import TiledImage, is_lazy
+
+# Images larger than this (in pixels along either dimension) are tiled, as they
+# would otherwise exceed the maximum texture size supported by most browsers
+MAX_TEXTURE_SIZE = 4096
 
 
-def imshow(ax, array, **kwargs):
-    image = Image(array, **kwargs)
+def imshow(ax, array, tiled=None, **kwargs):
+    if tiled is None:
+        # Lazy arrays are always tiled, so that they are never loaded in full
+        tiled = is_lazy(array) or max(np.shape(array)[:2]) > MAX_TEXTURE_SIZE
+    image = (TiledImage if tiled else Image)(array, **kwargs)
     ax.add_artist(image)
     ax.autoscale()
     return image
@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+import json
+import threading
+import time
+
+import ipywidgets as ipw
+from ipywidgets import comm as ipw_comm
+
+from .artist import Artist
+from .axes import Axes
+from .figure import Figure
+
+# Methods timed by the profiler, for each class
+_TIMED = {
+    Figure: ('__init__', '_flush'),
+    Axes: ('__init__', '_make_xticks', '_make_yticks', 'autoscale', '_update_layout',
+           'zoom', 'reset'),
+}
+# Methods timed for every artist class defining them
+_ARTIST_TIMED = ('__init__', '_send')
+
+
+class Profile:
+    """
+    Statistics collected by :func:`instrument`.
+
+    For each matplotgl object (figure, axes or artist), the profile records the
+    number of widgets created, the number of trait syncs (state updates) sent to the
+    frontend, the size of their JSON state and of their binary buffers, and the
+    number of calls and total time spent in the instrumented methods. Messages are
+    attributed to the innermost instrumented method running when they are sent, or
+    to ``'<other>'`` outside of these methods.
+    """
+
+    def __init__(self):
+        self._labels = {}
+        self._counts = defaultdict(int)
+        # Stack of running instrumented methods, per thread: ticks are computed in
+        # the figure's thread pool while the kernel thread keeps sending messages
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.stats = defaultdict(
+            lambda: {
+                'widgets': 0,
+                'syncs': 0,
+                'state_bytes': 0,
+                'buffer_bytes': 0,
+                'timings': defaultdict(lambda: [0, 0.0])
+            })
+
+    def _label(self, obj):
+        key = id(obj)
+        with self._lock:
+            if key not in self._labels:
+                name = type(obj).__name__
+                self._labels[key] = f'{name}#{self._counts[name]}'
+                self._counts[name] += 1
+            return self._labels[key]
+
+    @property
+    def _owners(self):
+        if not hasattr(self._local, 'owners'):
+            self._local.owners = []
+        return self._local.owners
+
+    def _owner(self):
+        owners = self._owners
+        return owners[-1] if owners else '<other>'
+
+    def _record_message(self, kind, state, buffers):
+        state_bytes = len(json.dumps(state, default=str))
+        buffer_bytes = sum(memoryview(b).nbytes for b in buffers or [])
+        with self._lock:
+            stats = self.stats[self._owner()]
+            stats[kind] += 1
+            stats['state_bytes'] += state_bytes
+            stats['buffer_bytes'] += buffer_bytes
+
+    def _timed(self, name, func):
+
+        @wraps(func)
+        def wrapper(obj, *args, **kwargs):
+            owner = self._label(obj)
+            self._owners.append(owner)
+            start = time.perf_counter()
+            try:
+                return func(obj, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    timing = self.stats[owner]['timings'][name]
+                    timing[0] += 1
+                    timing[1] += elapsed
+                self._owners.pop()
+
+        return wrapper
+
+    def to_dict(self):
+        """
+        Return the statistics as a dict, with timings as ``{'calls', 'time'}``.
+        """
+        out = {}
+        for owner, stats in self.stats.items():
+            out[owner] = dict(stats)
+            out[owner]['timings'] = {
+                name: dict(calls=calls, time=total)
+                for name, (calls, total) in stats['timings'].items()
+            }
+        return out
+
+    def to_json(self, **kwargs):
+        """
+        Return the statistics as a JSON string.
+
+        Parameters
+        ----------
+        **kwargs:
+            Forwarded to :func:`json.dumps`.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def table(self):
+        """
+        Return a summary table of the statistics, one row per object.
+        """
+        lines = [
+            f'{"object":<20}{"widgets":>8}{"syncs":>8}{"state [kB]":>12}'
+            f'{"buffers [kB]":>14}  timings [ms]'
+        ]
+        for owner, stats in self.stats.items():
+            timings = ', '.join(f'{name}: {1e3 * total:.2f} ({calls})'
+                                for name, (calls, total) in stats['timings'].items())
+            lines.append(f'{owner:<20}{stats["widgets"]:>8}{stats["syncs"]:>8}'
+                         f'{stats["state_bytes"] / 1e3:>12.1f}'
+                         f'{stats["buffer_bytes"] / 1e3:>14.1f}  {timings}')
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.table()
+
+
+def _artist_classes(cls=Artist):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _artist_classes(sub)
+
+
+@contextmanager
+def instrument():
+    """
+    Context manager profiling everything matplotgl does inside it. Widget messages,
+    and the time spent building ticks, autoscaling, laying out the axes, and
+    constructing and sending artist buffers, are recorded in the returned
+    :class:`Profile`.
+
+    The instrumentation patches the classes while the context is active, and has no
+    cost outside of it.
+
+    Examples
+    --------
+
+      with matplotgl.instrument() as profile:
+          fig, ax = matplotgl.subplots()
+          ax.plot(x, y)
+          ax.zoom([0, 10, -1, 1])
+      print(profile.table())
+    """
+    profile = Profile()
+    originals = []
+
+    def patch(owner, name, value):
+        originals.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, value)
+
+    for cls, names in _TIMED.items():
+        for name in names:
+            patch(cls, name, profile._timed(name, cls.__dict__[name]))
+    for cls in _artist_classes():
+        for name in _ARTIST_TIMED:
+            if name in cls.__dict__:
+                patch(cls, name, profile._timed(name, cls.__dict__[name]))
+
+    create_comm = ipw_comm.create_comm
+    widget_send = ipw.Widget._send
+
+    def counting_create_comm(*args, **kwargs):
+        data = kwargs.get('data') or {}
+        profile._record_message('widgets', data.get('state'), kwargs.get('buffers'))
+        return create_comm(*args, **kwargs)
+
+    def counting_send(widget, msg, buffers=None):
+        if msg.get('method') == 'update':
+            profile._record_message('syncs', msg.get('state'), buffers)
+        return widget_send(widget, msg, buffers=buffers)
+
+    patch(ipw_comm, 'create_comm', counting_create_comm)
+    patch(ipw.Widget, '_send', counting_send)
+    try:
+        yield profile
+    finally:
+        for owner, name, value in reversed(originals):
+            setattr(owner, name, value)
@@ -5,59 +5,278 @@ from matplotlib import colors as mplc
 import pythreejs as p3
 import numpy as np
 
+from .artist import Artist
+from .cache import release, shared
+from .decimation import minmax_indices
+from .encoding import (encode_frames, encode_positions, set_transform, transform_traits,
+                       unpack)
+from .stream import Stream
 
-class Line:
+# Number of pixel columns used to decimate a line before it is added to an axes
+_DEFAULT_DECIMATION_WIDTH = 1000
 
-    def __init__(self, x, y, fmt='-', color='C0', ls='solid', lw=1, ms=5, zorder=0):
 
-        self._x = np.asarray(x)
-        self._y = np.asarray(y)
-        self._zorder = zorder
-        self._geometry = p3.BufferGeometry(
-            attributes={
-                'position':
-                p3.BufferAttribute(array=np.array(
-                    [self._x, self._y,
-                     np.full_like(self._x, self._zorder - 50)],
-                    dtype='float32').T),
-            })
+class Line(Artist):
+
+    def __init__(self,
+                 x,
+                 y=None,
+                 fmt='-',
+                 color='C0',
+                 ls='solid',
+                 lw=1,
+                 ms=5,
+                 zorder=0,
+                 decimate=False,
+                 stream=False,
+                 maxlen=None,
+                 quantize=False):
+
+        super().__init__(zorder=zorder)
+        self._packed, self._x, self._y = unpack(x, y)
+        self._decimate = decimate
+        self._quantize = quantize
+        self._box = None
+        if self._decimate and np.any(np.diff(self._x) < 0):
+            raise ValueError('Line decimation requires x values sorted in '
+                             'ascending order.')
+        if self._decimate and stream:
+            raise ValueError('Line decimation is not supported in stream mode.')
 
         self._color = mplc.to_hex(color)
-        self._line = None
-        self._vertices = None
+        self._line_material = None
+        self._vertices_material = None
         if '-' in fmt:
             if ls == 'solid':
-                self._line_material = p3.LineBasicMaterial(color=self._color,
-                                                           linewidth=lw)
+                self._line_material = shared(p3.LineBasicMaterial,
+                                             color=self._color,
+                                             linewidth=lw)
             elif ls == 'dashed':
-                self._line_material = p3.LineDashedMaterial(color=self._color,
-                                                            linewidth=lw)
-            self._line = p3.Line(geometry=self._geometry, material=self._line_material)
-
+                self._line_material = shared(p3.LineDashedMaterial,
+                                             color=self._color,
+                                             linewidth=lw)
         if 'o' in fmt:
-            self._vertices_material = p3.PointsMaterial(color=self._color, size=ms)
-            self._vertices = p3.Points(geometry=self._geometry,
-                                       material=self._vertices_material)
-
-    def get_bbox(self):
-        pad = 0.03
-        xmin = self._x.min()
-        xmax = self._x.max()
-        padx = pad * (xmax - xmin)
-        ymin = self._y.min()
-        ymax = self._y.max()
-        pady = pad * (ymax - ymin)
+            self._vertices_material = shared(p3.PointsMaterial,
+                                             color=self._color,
+                                             size=ms)
+
+        self._stream = None
+        if stream:
+            self._stream = Stream(self._make_object, z=self._zorder - 50, maxlen=maxlen)
+            self._stream.append(self._x, self._y)
+            self._stream.flush()
+            self._packed = self._x = self._y = None
+        else:
+            positions, origin, scale = self._make_positions()
+            self._geometry = p3.BufferGeometry(
+                attributes={
+                    'position': p3.BufferAttribute(array=positions),
+                })
+            self._object = self._make_object(self._geometry)
+            set_transform(self._object, origin, scale, z=self._zorder - 50)
+
+    def _make_object(self, geometry):
+        """
+        Make the threejs line and/or markers drawing the given geometry.
+        """
+        out = []
+        if self._line_material is not None:
+            out.append(
+                p3.Line(geometry=geometry,
+                        material=self._line_material,
+                        frustumCulled=False))
+        if self._vertices_material is not None:
+            out.append(
+                p3.Points(geometry=geometry,
+                          material=self._vertices_material,
+                          frustumCulled=False))
+        return p3.Group(children=out) if len(out) > 1 else out[0]
+
+    def _get_data(self):
+        if self._stream is not None:
+            return self._stream.get_data()
+        return self._x, self._y
+
+    def _make_positions(self, box=None, quantize=None):
+        """
+        Make the encoded vertex positions sent to the frontend, and their origin and
+        scale (see :func:`encode_positions`). When decimation is enabled, only the
+        samples needed to draw the line in the range given by ``box`` (or the full
+        range if ``None``) are kept.
+        """
+        x, y = self._scaled_data()
+        # The packed array can only be sent if the scales left the data unchanged
+        packed = self._packed if x is self._x and y is self._y else None
+        if self._decimate and len(x) > 0:
+            # Samples masked by a log scale come first, as x is sorted
+            start = self._get_scale('x').first_valid(self._x)
+            x = x[start:]
+            y = y[start:]
+            if box is None:
+                left, right = (x[0], x[-1]) if len(x) else (0, 1)
+                ncols = _DEFAULT_DECIMATION_WIDTH
+            else:
+                # Also decimate one view width either side of the visible range,
+                # so that the line does not disappear at the edges when panning.
+                span = box[1] - box[0]
+                left, right = box[0] - span, box[1] + span
+                ncols = 3 * int(self._ax.width)
+            ind = minmax_indices(x, y, left=left, right=right, ncols=ncols)
+            x = x[ind]
+            y = y[ind]
+            packed = None
+        return encode_positions(
+            x,
+            y,
+            quantize=self._quantize if quantize is None else quantize,
+            packed=packed)
+
+    def _check_scale(self, scale):
+        if self._stream is not None and not scale.linear:
+            raise ValueError(f'Lines in stream mode cannot be drawn on {scale.name} '
+                             'axes.')
+
+    def _rescale(self):
+        # The decimation range is in the coordinates of the previous scale
+        self._box = None
+        super()._rescale()
+
+    def _reset_view(self):
+        self._box = None
+
+    def _apply_zoom(self, box):
+        self._box = box
+        if self._decimate:
+            self._request_view(box)
+
+    def _compute_view(self, box):
+        return self._make_positions(box)
+
+    def _apply_view(self, result):
+        positions, origin, scale = result
+        self._geometry.attributes['position'].array = positions
+        set_transform(self._object, origin, scale, z=self._zorder - 50)
+
+    def _send(self, parts):
+        if 'position' in parts:
+            self._cancel_view()
+            self._apply_view(self._make_positions(self._box))
+        if 'stream' in parts:
+            self._stream.flush()
+
+    def append(self, x, y):
+        """
+        Append new samples to the line. In stream mode, only the new samples are
+        sent to the frontend. Otherwise, the whole line is resent.
+
+        Parameters
+        ----------
+        x:
+            The x coordinates of the new samples.
+        y:
+            The y coordinates of the new samples.
+        """
+        if self._stream is not None:
+            self._stream.append(x, y)
+            self._request_send('stream')
+        else:
+            x = np.ravel(x)
+            if self._decimate and np.any(
+                    np.diff(np.concatenate([self._x[-1:], x])) < 0):
+                raise ValueError('Line decimation requires x values sorted in '
+                                 'ascending order.')
+            self._packed = None
+            self._x = np.concatenate([self._x, x])
+            self._y = np.concatenate([self._y, np.ravel(y)])
+            self._request_send('position')
+        self._invalidate_bbox()
+        self._data_changed(appended=self._stream is None)
+
+    def set_data(self, xy):
+        """
+        Replace the line vertices with an (N, 2) or (N, 3) array. A C-contiguous
+        float32 array is kept and sent without copying.
+
+        Parameters
+        ----------
+        xy:
+            The new vertices.
+        """
+        packed, x, y = unpack(xy)
+        if self._decimate and np.any(np.diff(x) < 0):
+            raise ValueError('Line decimation requires x values sorted in '
+                             'ascending order.')
+        if self._stream is not None:
+            self._stream.clear()
+            self._stream.append(x, y)
+            self._request_send('stream')
+        else:
+            self._packed, self._x, self._y = packed, x, y
+            self._request_send('position')
+        self._invalidate_bbox()
+        self._data_changed()
+
+    def _export_overrides(self, quantize, max_points):
+        if self._stream is not None:
+            return {}
+        x, y = self._scaled_data()
+        if max_points is not None and len(x) > max_points:
+            if self._decimate or np.all(np.diff(self._x) >= 0):
+                start = self._get_scale('x').first_valid(self._x)
+                ind = start + minmax_indices(x[start:],
+                                             y[start:],
+                                             left=x[start],
+                                             right=x[-1],
+                                             ncols=max(max_points // 4, 1))
+            else:
+                ind = np.linspace(0, len(x) - 1, max_points).astype(int)
+            positions, origin, scale = encode_positions(x[ind],
+                                                        y[ind],
+                                                        quantize=quantize
+                                                        or self._quantize)
+        elif quantize and not self._quantize:
+            positions, origin, scale = self._make_positions(self._box, quantize=True)
+        else:
+            return {}
         return {
-            'left': xmin - padx,
-            'right': xmax + padx,
-            'bottom': ymin - pady,
-            'top': ymax + pady
+            self._geometry.attributes['position']: {
+                'array': positions
+            },
+            self._object: transform_traits(origin, scale, z=self._zorder - 50)
         }
 
+    def _frame_state(self):
+        if self._stream is not None:
+            raise ValueError('Precomputed animation frames are not supported in '
+                             'stream mode.')
+        return np.array(self._x), np.array(self._y)
+
+    def _set_frame_state(self, state):
+        self._packed = None
+        self._x, self._y = state
+        self._request_send('position')
+        self._invalidate_bbox()
+        self._data_changed()
+
+    def _make_frames(self, states):
+        views, origin, scale = encode_frames([self._transform(x, y) for x, y in states],
+                                             quantize=self._quantize)
+        return [
+            p3.Group(children=[
+                self._make_object(
+                    p3.BufferGeometry(
+                        attributes={'position': p3.BufferAttribute(array=positions)}))
+            ],
+                     visible=False,
+                     **transform_traits(origin, scale, z=self._zorder - 50))
+            for positions in views
+        ]
+
+    def _pick(self, x, y, scale, radius):
+        return self._nearest_sample(x, y, scale, radius)
+
+    def _release(self):
+        release(self._line_material, self._vertices_material)
+
     def get(self):
-        out = []
-        if self._line is not None:
-            out.append(self._line)
-        if self._vertices is not None:
-            out.append(self._vertices)
-        return p3.Group(children=out) if len(out) > 1 else out[0]
+        return self._object if self._stream is None else self._stream.group
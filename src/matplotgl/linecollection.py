@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+from matplotlib import colors as mplc
+import numpy as np
+import pythreejs as p3
+
+from .artist import Artist
+from .cache import release, shared
+from .encoding import encode_positions, set_transform, transform_traits
+
+
+class LineCollection(Artist):
+    """
+    Many lines drawn with a single geometry and a single draw call.
+
+    The vertices of all the lines are packed into one position buffer, and an index
+    buffer lists the pairs of consecutive vertices drawn as segments, skipping the
+    gap between the end of one line and the start of the next. Colours are given
+    per line, and stored as a per-vertex uint8 colour attribute.
+
+    Parameters
+    ----------
+    segments:
+        The lines, as a list of (N, 2) arrays of vertices (the lines may have
+        different lengths), or a single (nlines, N, 2) array.
+    colors:
+        The colour of each line, or a single colour for all the lines. If ``None``,
+        the lines cycle through the default colours.
+    lw:
+        The line width.
+    zorder:
+        The depth of the lines.
+    quantize:
+        If ``True``, send the positions as 16-bit integers.
+    """
+
+    def __init__(self, segments, colors=None, lw=1, zorder=0, quantize=False):
+
+        super().__init__(zorder=zorder)
+        self._quantize = quantize
+        self._lengths = None
+        self._set_vertices(segments)
+        self._set_colors(colors)
+        self._material = shared(p3.LineBasicMaterial,
+                                vertexColors='VertexColors',
+                                linewidth=lw)
+        positions, origin, scale = self._make_positions()
+        self._geometry = p3.BufferGeometry(
+            attributes={
+                'position': p3.BufferAttribute(array=positions),
+                'color': p3.BufferAttribute(array=self._make_colors())
+            },
+            index=p3.BufferAttribute(array=self._make_index()))
+        self._segments = p3.LineSegments(geometry=self._geometry,
+                                         material=self._material,
+                                         frustumCulled=False)
+        set_transform(self._segments, origin, scale, z=self._zorder - 50)
+
+    def _set_vertices(self, segments):
+        """
+        Pack the lines into a single (N, 2) array of vertices. Returns ``True`` if
+        the lengths of the lines changed.
+        """
+        if isinstance(segments, np.ndarray) and segments.ndim == 3:
+            lengths = np.full(segments.shape[0], segments.shape[1])
+            vertices = segments.reshape(-1, 2)
+        else:
+            segments = [np.asarray(s) for s in segments]
+            lengths = np.array([len(s) for s in segments], dtype=int)
+            vertices = (np.concatenate(segments) if segments else np.empty((0, 2)))
+        changed = not np.array_equal(lengths, self._lengths)
+        self._vertices = vertices
+        self._lengths = lengths
+        return changed
+
+    def _set_colors(self, colors):
+        nlines = len(self._lengths)
+        if colors is None:
+            colors = [f'C{i % 10}' for i in range(nlines)]
+        rgb = np.broadcast_to(mplc.to_rgba_array(colors)[:, :3], (nlines, 3))
+        self._colors = np.round(rgb * 255).astype('uint8')
+
+    def _get_data(self):
+        return self._vertices[:, 0], self._vertices[:, 1]
+
+    def _make_positions(self, quantize=None):
+        x, y = self._scaled_data()
+        return encode_positions(
+            x, y, quantize=self._quantize if quantize is None else quantize)
+
+    def _make_colors(self):
+        """
+        Repeat the line colours for every vertex of each line.
+        """
+        return np.repeat(self._colors, self._lengths, axis=0)
+
+    def _make_index(self):
+        """
+        Make the indices of the segment end points: every vertex except the last
+        one of each line is joined to the next vertex.
+        """
+        ends = np.cumsum(self._lengths)
+        keep = np.ones(len(self._vertices), dtype=bool)
+        keep[ends[self._lengths > 0] - 1] = False
+        starts = np.flatnonzero(keep).astype('uint32')
+        return np.stack([starts, starts + 1], axis=1).ravel()
+
+    def _send(self, parts):
+        if 'position' in parts:
+            positions, origin, scale = self._make_positions()
+            self._geometry.attributes['position'].array = positions
+            set_transform(self._segments, origin, scale, z=self._zorder - 50)
+        if 'index' in parts:
+            self._geometry.index.array = self._make_index()
+        if 'color' in parts:
+            self._geometry.attributes['color'].array = self._make_colors()
+
+    def set_segments(self, segments):
+        """
+        Replace the lines. If the number and lengths of the lines are unchanged,
+        only the positions are sent.
+
+        Parameters
+        ----------
+        segments:
+            The new lines, in the same format as in the constructor.
+        """
+        if self._set_vertices(segments):
+            if len(self._colors) != len(self._lengths):
+                self._set_colors(None)
+            self._request_send('position', 'index', 'color')
+        else:
+            self._request_send('position')
+        self._invalidate_bbox()
+        self._data_changed()
+
+    def set_colors(self, colors):
+        """
+        Change the colours of the lines.
+
+        Parameters
+        ----------
+        colors:
+            The colour of each line, or a single colour for all the lines.
+        """
+        self._set_colors(colors)
+        self._request_send('color')
+
+    def get_colors(self):
+        return self._colors / 255
+
+    def _export_overrides(self, quantize, max_points):
+        if not quantize or self._quantize:
+            return {}
+        positions, origin, scale = self._make_positions(quantize=True)
+        return {
+            self._geometry.attributes['position']: {
+                'array': positions
+            },
+            self._segments: transform_traits(origin, scale, z=self._zorder - 50)
+        }
+
+    def _release(self):
+        release(self._material)
+
+    def get(self):
+        return self._segments
@@ -1,7 +1,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
 
+import numpy as np
+
 from .line import Line
+from .linecollection import LineCollection
 
 
 def plot(ax, *args, **kwargs):
@@ -9,3 +12,12 @@ def plot(ax, *args, **kwargs):
     ax.add_artist(line)
     ax.autoscale()
     return line
+
+
+def plot_many(ax, x, y, **kwargs):
+    y = np.asarray(y)
+    x = np.broadcast_to(x, y.shape)
+    coll = LineCollection(np.stack([x, y], axis=-1), **kwargs)
+    ax.add_artist(coll)
+    ax.autoscale()
+    return coll
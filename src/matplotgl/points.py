@@ -1,63 +1,323 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
 
+import matplotlib as mpl
 from matplotlib import colors as mplc
 import numpy as np
 import pythreejs as p3
 
+from .artist import Artist
+from .cache import release, shared
+from .encoding import (encode_frames, encode_positions, set_transform, transform_traits,
+                       unpack)
+from .stream import Stream
+from .utils import colormap_lut, lut_indices
 
-class Points:
+# Points with per-vertex sizes, which PointsMaterial does not support. Vertex
+# colours are used when the material has vertexColors enabled (USE_COLOR).
+_VERTEX_SHADER = """
+attribute float size;
+varying vec3 vColor;
 
-    def __init__(self, x, y, color='C0', s=3, zorder=0) -> None:
+void main() {
+#ifdef USE_COLOR
+    vColor = color;
+#endif
+    gl_PointSize = size;
+    gl_Position = projectionMatrix * modelViewMatrix * vec4(position, 1.0);
+}
+"""
 
-        self._x = np.asarray(x)
-        self._y = np.asarray(y)
-        self._zorder = zorder
+_FRAGMENT_SHADER = """
+uniform vec3 diffuse;
+varying vec3 vColor;
+
+void main() {
+#ifdef USE_COLOR
+    gl_FragColor = vec4(vColor, 1.0);
+#else
+    gl_FragColor = vec4(diffuse, 1.0);
+#endif
+}
+"""
+
+
+class Points(Artist):
+
+    def __init__(self,
+                 x,
+                 y=None,
+                 color='C0',
+                 s=3,
+                 c=None,
+                 cmap='viridis',
+                 vmin=None,
+                 vmax=None,
+                 zorder=0,
+                 stream=False,
+                 maxlen=None,
+                 quantize=False) -> None:
+
+        super().__init__(zorder=zorder)
+        self._packed, self._x, self._y = unpack(x, y)
         self._color = mplc.to_hex(color)
-        self._geometry = p3.BufferGeometry(
-            attributes={
-                'position':
-                p3.BufferAttribute(array=np.array(
-                    [self._x, self._y,
-                     np.full_like(self._x, self._zorder - 50)],
-                    dtype='float32').T),
-            })
-        self._material = p3.PointsMaterial(color=self._color, size=s)
-        self._points = p3.Points(geometry=self._geometry, material=self._material)
-
-    def get_bbox(self):
-        pad = 0.03
-        xmin = self._x.min()
-        xmax = self._x.max()
-        padx = pad * (xmax - xmin)
-        ymin = self._y.min()
-        ymax = self._y.max()
-        pady = pad * (ymax - ymin)
-        return {
-            'left': xmin - padx,
-            'right': xmax + padx,
-            'bottom': ymin - pady,
-            'top': ymax + pady
+        self._c = None if c is None else np.asarray(c)
+        self._s = s if np.isscalar(s) else np.asarray(s, dtype='float32')
+        self._cmap = mpl.colormaps[cmap]
+        self._vmin = vmin
+        self._vmax = vmax
+        self._quantize = quantize
+        self._stream = None
+        per_vertex = (self._c is not None) or (not np.isscalar(self._s))
+        if stream and per_vertex:
+            raise ValueError('Per-point colours and sizes are not supported in '
+                             'stream mode.')
+
+        vertex_colors = 'NoColors' if self._c is None else 'VertexColors'
+        if np.isscalar(self._s):
+            self._material = shared(p3.PointsMaterial,
+                                    color=self._color if self._c is None else 'white',
+                                    size=self._s,
+                                    vertexColors=vertex_colors)
+        else:
+            self._material = p3.ShaderMaterial(
+                uniforms={'diffuse': dict(value=self._color)},
+                vertexColors=vertex_colors,
+                vertexShader=_VERTEX_SHADER,
+                fragmentShader=_FRAGMENT_SHADER)
+
+        if stream:
+            self._stream = Stream(self._make_object, z=self._zorder - 50, maxlen=maxlen)
+            self._update()
+        else:
+            positions, origin, scale = encode_positions(self._x,
+                                                        self._y,
+                                                        quantize=self._quantize,
+                                                        packed=self._packed)
+            attributes = {'position': p3.BufferAttribute(array=positions)}
+            if self._c is not None:
+                attributes['color'] = p3.BufferAttribute(array=self._make_colors())
+            if not np.isscalar(self._s):
+                attributes['size'] = p3.BufferAttribute(array=self._s)
+            self._geometry = p3.BufferGeometry(attributes=attributes)
+            self._points = self._make_object(self._geometry)
+            set_transform(self._points, origin, scale, z=self._zorder - 50)
+
+    def _make_colors(self):
+        """
+        Map the point values through the colormap into a (N, 3) uint8 array. NaNs
+        get the "bad" colour of the colormap.
+        """
+        if self._vmin is None:
+            self._vmin = np.nanmin(self._c)
+        if self._vmax is None:
+            self._vmax = np.nanmax(self._c)
+        colors = colormap_lut(
+            self._cmap)[lut_indices(self._c, self._vmin, self._vmax), :3]
+        if self._c.dtype.kind == 'f':
+            bad = np.round(np.asarray(self._cmap.get_bad()[:3]) * 255).astype(np.uint8)
+            colors[np.isnan(self._c)] = bad
+        return colors
+
+    def _make_object(self, geometry):
+        return p3.Points(geometry=geometry,
+                         material=self._material,
+                         frustumCulled=False)
+
+    def _get_data(self):
+        if self._stream is not None:
+            return self._stream.get_data()
+        return self._x, self._y
+
+    def _update(self, appended=False):
+        self._invalidate_bbox()
+        self._data_changed(appended=appended and self._stream is None)
+        if self._stream is not None:
+            # In stream mode, the data only lives in the stream buffers
+            self._stream.clear()
+            self._stream.append(self._x, self._y)
+            self._packed = self._x = self._y = None
+            self._request_send('stream')
+        else:
+            self._request_send('position')
+
+    def _check_scale(self, scale):
+        if self._stream is not None and not scale.linear:
+            raise ValueError(f'Points in stream mode cannot be drawn on {scale.name} '
+                             'axes.')
+
+    def _scaled_positions(self):
+        """
+        The point coordinates in scene coordinates, and the packed array if the
+        scales left them unchanged.
+        """
+        x, y = self._scaled_data()
+        return x, y, self._packed if x is self._x and y is self._y else None
+
+    def _send(self, parts):
+        if 'position' in parts:
+            x, y, packed = self._scaled_positions()
+            positions, origin, scale = encode_positions(x,
+                                                        y,
+                                                        quantize=self._quantize,
+                                                        packed=packed)
+            self._geometry.attributes['position'].array = positions
+            set_transform(self._points, origin, scale, z=self._zorder - 50)
+        if 'stream' in parts:
+            self._stream.flush()
+        if 'color' in parts:
+            self._geometry.attributes['color'].array = self._make_colors()
+        if 'size' in parts:
+            self._geometry.attributes['size'].array = self._s
+
+    def _export_overrides(self, quantize, max_points):
+        if self._stream is not None:
+            return {}
+        x, y, packed = self._scaled_positions()
+        ind = None
+        if max_points is not None and len(x) > max_points:
+            # Keep evenly spaced points, along with their colours and sizes
+            ind = np.linspace(0, len(x) - 1, max_points).astype(int)
+            x, y, packed = x[ind], y[ind], None
+        elif not quantize or self._quantize:
+            return {}
+        positions, origin, scale = encode_positions(x,
+                                                    y,
+                                                    quantize=quantize or self._quantize,
+                                                    packed=packed)
+        attributes = self._geometry.attributes
+        out = {
+            attributes['position']: {
+                'array': positions
+            },
+            self._points: transform_traits(origin, scale, z=self._zorder - 50)
         }
+        if ind is not None:
+            if 'color' in attributes:
+                out[attributes['color']] = {'array': self._make_colors()[ind]}
+            if 'size' in attributes:
+                out[attributes['size']] = {'array': self._s[ind]}
+        return out
+
+    def _frame_state(self):
+        if self._stream is not None:
+            raise ValueError('Precomputed animation frames are not supported in '
+                             'stream mode.')
+        return np.array(self._x), np.array(self._y)
+
+    def _set_frame_state(self, state):
+        self._packed = None
+        self._x, self._y = state
+        self._update()
+
+    def _make_frames(self, states):
+        views, origin, scale = encode_frames([self._transform(x, y) for x, y in states],
+                                             quantize=self._quantize)
+        # The colour and size buffers do not change, and are shared by all frames
+        shared_attributes = {
+            key: value
+            for key, value in self._geometry.attributes.items() if key != 'position'
+        }
+        sizes = {len(attribute.array) for attribute in shared_attributes.values()}
+        if any(len(x) not in sizes for x, _ in states) and sizes:
+            raise ValueError('Per-point colours and sizes require the same number of '
+                             'points in every frame.')
+        return [
+            p3.Group(children=[
+                self._make_object(
+                    p3.BufferGeometry(
+                        attributes={
+                            'position': p3.BufferAttribute(array=positions),
+                            **shared_attributes
+                        }))
+            ],
+                     visible=False,
+                     **transform_traits(origin, scale, z=self._zorder - 50))
+            for positions in views
+        ]
+
+    def _pick(self, x, y, scale, radius):
+        hit = self._nearest_sample(x, y, scale, radius)
+        if hit is not None and self._c is not None and hit[1]['index'] < len(self._c):
+            hit[1]['value'] = self._c[hit[1]['index']]
+        return hit
 
-    def _update(self):
-        self._geometry.attributes['position'].array = np.array(
-            [self._x, self._y,
-             np.full_like(self._x, self._zorder - 50)],
-            dtype='float32').T
+    def _release(self):
+        release(self._material)
 
     def get(self):
-        return self._points
+        return self._points if self._stream is None else self._stream.group
 
     def set_xdata(self, x):
-        self._x = np.asarray(x)
+        self._packed, self._x, self._y = unpack(x, self._get_data()[1])
         self._update()
 
     def set_ydata(self, y):
-        self._y = np.asarray(y)
+        self._packed, self._x, self._y = unpack(self._get_data()[0], y)
         self._update()
 
     def set_data(self, xy):
-        self._x = np.asarray(xy[:, 0])
-        self._y = np.asarray(xy[:, 1])
+        """
+        Set the point positions from an (N, 2) or (N, 3) array. A C-contiguous
+        float32 array is kept and sent without copying.
+
+        Parameters
+        ----------
+        xy:
+            The new positions.
+        """
+        self._packed, self._x, self._y = unpack(xy)
         self._update()
+
+    def set_array(self, c):
+        """
+        Set the values mapped to the point colours. Only the colour buffer is resent.
+
+        Parameters
+        ----------
+        c:
+            The new values, one per point.
+        """
+        if self._c is None:
+            raise ValueError('Points were created with a single colour, use c= to '
+                             'enable per-point colours.')
+        self._c = np.asarray(c)
+        self._request_send('color')
+
+    def set_sizes(self, s):
+        """
+        Set the point sizes. Only the size buffer is resent.
+
+        Parameters
+        ----------
+        s:
+            The new sizes, one per point.
+        """
+        if np.isscalar(self._s):
+            raise ValueError('Points were created with a single size, use an array '
+                             'for s to enable per-point sizes.')
+        self._s = np.asarray(s, dtype='float32')
+        self._request_send('size')
+
+    def append(self, x, y):
+        """
+        Append new points. In stream mode, only the new points are sent to the
+        frontend. Otherwise, all the points are resent.
+
+        Parameters
+        ----------
+        x:
+            The x coordinates of the new points.
+        y:
+            The y coordinates of the new points.
+        """
+        if self._stream is not None:
+            self._stream.append(x, y)
+            self._invalidate_bbox()
+            self._data_changed()
+            self._request_send('stream')
+        else:
+            self._packed = None
+            self._x = np.concatenate([self._x, np.ravel(x)])
+            self._y = np.concatenate([self._y, np.ravel(y)])
+            self._update(appended=True)
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+import numpy as np
+
+_SCALES = ('linear', 'log', 'symlog')
+
+
+class Scale:
+    """
+    The mapping from data to scene coordinates along one axis of an :class:`Axes`.
+    Artists are drawn, zoomed and picked in scene coordinates, and only the tick
+    labels and hover values are given in data coordinates.
+
+    The transforms are those of Matplotlib's ``LogScale`` and ``SymmetricalLogScale``
+    in base 10. Non-positive values are masked (mapped to NaN) on a log axis.
+
+    Parameters
+    ----------
+    name:
+        ``'linear'``, ``'log'`` or ``'symlog'``.
+    linthresh:
+        For ``'symlog'``, the range ``(-linthresh, linthresh)`` around zero within
+        which the axis is linear.
+    """
+
+    def __init__(self, name='linear', linthresh=1.0):
+        if name not in _SCALES:
+            raise ValueError(f'Unknown scale {name!r}, expected one of {_SCALES}.')
+        if linthresh <= 0:
+            raise ValueError('The linear threshold of a symlog scale must be '
+                             'positive.')
+        self.name = name
+        self.linthresh = float(linthresh) if name == 'symlog' else None
+        # Scale of the linear part of a symlog axis, so that a decade and the
+        # linear range have the same length (matplotlib's linscale=1)
+        self._linscale = 1 / (1 - 1 / 10)
+
+    @property
+    def linear(self):
+        return self.name == 'linear'
+
+    def __eq__(self, other):
+        return (isinstance(other, Scale) and self.name == other.name
+                and self.linthresh == other.linthresh)
+
+    def __hash__(self):
+        return hash((self.name, self.linthresh))
+
+    def __repr__(self):
+        return f'Scale({self.name!r})'
+
+    def forward(self, values, dtype='float64'):
+        """
+        Transform data values into scene coordinates, as a new array of the given
+        type. Linear scales return the values unchanged.
+        """
+        values = np.asarray(values)
+        if self.linear:
+            return values
+        out = np.empty(values.shape, dtype=dtype)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.name == 'log':
+                np.log10(values, out=out)
+                out[~(values > 0)] = np.nan
+            else:
+                np.abs(values, out=out)
+                outer = out > self.linthresh
+                out[outer] = self.linthresh * (self._linscale +
+                                               np.log10(out[outer] / self.linthresh))
+                out[~outer] *= self._linscale
+                np.copysign(out, values, out=out)
+        return out
+
+    def inverse(self, values):
+        """
+        Transform scene coordinates back into data values.
+        """
+        values = np.asarray(values, dtype=float)
+        if self.linear:
+            return values
+        if self.name == 'log':
+            return 10**values
+        magnitude = np.abs(values)
+        return np.copysign(
+            np.where(magnitude > self.linthresh * self._linscale,
+                     self.linthresh * 10**(magnitude / self.linthresh - self._linscale),
+                     magnitude / self._linscale), values)
+
+    def first_valid(self, values):
+        """
+        Return the number of leading values of an ascending array which the scale
+        masks, i.e. the non-positive values on a log axis.
+        """
+        if self.name == 'log':
+            return int(np.searchsorted(values, 0, side='right'))
+        return 0
+
+
+LINEAR = Scale()
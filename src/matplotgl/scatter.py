@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
 
+from .aggregate import AggregatedPoints
 from .points import Points
 
 
-def scatter(ax, x, y, **kwargs):
-    pts = Points(x=x, y=y, **kwargs)
+def scatter(ax, x, y=None, aggregate=False, **kwargs):
+    pts = (AggregatedPoints if aggregate else Points)(x=x, y=y, **kwargs)
     ax.add_artist(pts)
     ax.autoscale()
     return pts
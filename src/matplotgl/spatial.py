@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+import numpy as np
+
+# Average number of samples per grid cell
+_POINTS_PER_CELL = 4
+
+# Upper bound on the number of cells along each dimension
+_MAX_CELLS = 4096
+
+
+class GridIndex:
+    """
+    Uniform grid over a set of 2D samples, answering nearest-sample queries for
+    hover and picking.
+
+    The samples are sorted by grid cell, so that the samples of a row of cells are
+    a contiguous slice of the sort order, and a query only measures the distances
+    to the samples in the cells around the query point. Samples appended with
+    :meth:`extend` are kept in a tail which is searched exhaustively, and merged
+    into the grid once it grows larger than a fraction of it. NaN samples are never
+    returned.
+
+    Parameters
+    ----------
+    x:
+        The x coordinates.
+    y:
+        The y coordinates.
+    """
+
+    def __init__(self, x, y):
+        self._x = np.asarray(x)
+        self._y = np.asarray(y)
+        self._build()
+
+    def _build(self):
+        x = self._x
+        y = self._y
+        self._size = len(x)
+        finite = np.isfinite(x) & np.isfinite(y)
+        ind = np.flatnonzero(finite)
+        if len(ind) == 0:
+            self._origin = (0.0, 0.0)
+            self._cell = (1.0, 1.0)
+            self._shape = (1, 1)
+            self._order = ind
+            self._starts = np.zeros(2, dtype=np.intp)
+            return
+        xmin, xmax = x[ind].min(), x[ind].max()
+        ymin, ymax = y[ind].min(), y[ind].max()
+        ncells = min(max(len(ind) // _POINTS_PER_CELL, 1), _MAX_CELLS**2)
+        nx = min(max(int(np.sqrt(ncells)), 1), _MAX_CELLS)
+        ny = min(max(ncells // nx, 1), _MAX_CELLS)
+        self._origin = (float(xmin), float(ymin))
+        self._cell = (float(xmax - xmin) / nx or 1.0, float(ymax - ymin) / ny or 1.0)
+        self._shape = (ny, nx)
+        cells = self._cell_index(x[ind], y[ind])
+        order = np.argsort(cells, kind='stable')
+        self._order = ind[order]
+        self._starts = np.concatenate([[0],
+                                       np.cumsum(np.bincount(cells,
+                                                             minlength=nx * ny))])
+
+    def _cell_index(self, x, y):
+        ny, nx = self._shape
+        ix = np.clip(((x - self._origin[0]) / self._cell[0]).astype(np.intp), 0, nx - 1)
+        iy = np.clip(((y - self._origin[1]) / self._cell[1]).astype(np.intp), 0, ny - 1)
+        return iy * nx + ix
+
+    def extend(self, x, y):
+        """
+        Update the index after samples were appended to the data.
+
+        Parameters
+        ----------
+        x:
+            All the x coordinates, starting with those already in the index.
+        y:
+            All the y coordinates.
+        """
+        self._x = np.asarray(x)
+        self._y = np.asarray(y)
+        if len(self._x) - self._size > max(1024, self._size // 8):
+            self._build()
+
+    def position(self, index):
+        """
+        Return the coordinates of a sample.
+        """
+        return self._x[index], self._y[index]
+
+    def _candidates(self, x, y, rx, ry):
+        """
+        The indices of the samples in the cells overlapping the rectangle of
+        half-sizes ``rx`` and ``ry`` around ``(x, y)``, and of the tail samples.
+        """
+        ny, nx = self._shape
+        ix0, ix1 = (int(
+            np.clip(np.floor((v - self._origin[0]) / self._cell[0]), 0, nx - 1))
+                    for v in (x - rx, x + rx))
+        iy0, iy1 = (int(
+            np.clip(np.floor((v - self._origin[1]) / self._cell[1]), 0, ny - 1))
+                    for v in (y - ry, y + ry))
+        starts = self._starts
+        slices = [
+            self._order[starts[row * nx + ix0]:starts[row * nx + ix1 + 1]]
+            for row in range(iy0, iy1 + 1)
+        ]
+        slices.append(np.arange(self._size, len(self._x)))
+        return np.concatenate(slices)
+
+    def query(self, x, y, scale, radius):
+        """
+        Find the sample nearest to ``(x, y)``, with distances measured in screen
+        pixels. Returns ``(index, distance)``, or ``None`` if no sample lies within
+        ``radius`` pixels.
+
+        Parameters
+        ----------
+        x:
+            The x coordinate of the query point.
+        y:
+            The y coordinate of the query point.
+        scale:
+            The number of pixels per data unit along x and y.
+        radius:
+            The search radius, in pixels.
+        """
+        ind = self._candidates(x, y, radius / scale[0], radius / scale[1])
+        if len(ind) == 0:
+            return None
+        dist = np.hypot((self._x[ind] - x) * scale[0], (self._y[ind] - y) * scale[1])
+        best = np.nanargmin(dist) if np.isfinite(dist).any() else None
+        if best is None or dist[best] > radius:
+            return None
+        return int(ind[best]), float(dist[best])
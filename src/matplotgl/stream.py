@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+import numpy as np
+import pythreejs as p3
+
+
+class Stream:
+    """
+    Vertex positions of an artist which is fed incrementally with ``append``.
+
+    The positions are written into preallocated float32 blocks of fixed size, each
+    with its own geometry in the frontend. Appending samples marks the block(s)
+    receiving them as dirty, and only those are resent on ``flush``, so the cost of
+    an update is bounded by the block size instead of growing with the total
+    history. The first vertex of each block repeats the last sample of the previous
+    block so that lines are continuous, and unused vertices at the end of the
+    newest block are collapsed onto the last sample. Positions are stored relative
+    to the first sample, which is used as the position of the block objects, to
+    keep float32 precision for large coordinates.
+
+    With ``maxlen``, all blocks are allocated up front and recycled as a ring
+    buffer: the oldest samples are discarded one block at a time, so that at least
+    the ``maxlen`` most recent samples are kept.
+
+    Parameters
+    ----------
+    make_object:
+        Function making the threejs object (line, points) for a block geometry.
+    z:
+        The z coordinate of the block objects.
+    maxlen:
+        The maximum number of samples to keep. Unbounded if ``None``.
+    block_size:
+        The number of samples per block.
+    """
+
+    def __init__(self, make_object, z, maxlen=None, block_size=4096):
+        self._make_object = make_object
+        self._z = z
+        self._origin = None
+        self._block_size = block_size
+        self._nblocks = None
+        self._storage = None
+        if maxlen is not None:
+            self._nblocks = -(-maxlen // block_size) + 1
+            self._storage = np.empty((self._nblocks, block_size + 1, 2),
+                                     dtype='float32')
+        # Blocks currently in use, oldest first. Each one is a dict holding the
+        # positions array, the buffer attribute and the threejs object.
+        self._blocks = []
+        self._spare = []
+        self._dirty = []
+        self._count = 0
+        self.group = p3.Group()
+
+    def _next_block(self):
+        """
+        Start a new block, recycling the oldest one when the ring is full.
+        """
+        if self._blocks and (len(self._blocks) == self._nblocks):
+            block = self._blocks.pop(0)
+            # The oldest remaining block no longer connects to discarded data
+            oldest = self._blocks[0] if self._blocks else None
+            if oldest is not None:
+                oldest['positions'][0] = oldest['positions'][1]
+                self._mark_dirty(oldest)
+        elif self._spare:
+            block = self._spare.pop()
+        else:
+            # The frontend objects are only made when the block is first sent
+            block = {
+                'positions':
+                (np.empty((self._block_size + 1, 2), dtype='float32')
+                 if self._storage is None else self._storage[len(self._blocks)]),
+                'attribute':
+                None,
+                'object':
+                None
+            }
+        if self._blocks:
+            block['positions'][0] = self._blocks[-1]['positions'][-1]
+        self._blocks.append(block)
+        self._count = 0
+        return block
+
+    def _mark_dirty(self, block):
+        if not any(b is block for b in self._dirty):
+            self._dirty.append(block)
+
+    def _send(self, block):
+        if block['attribute'] is None:
+            block['attribute'] = p3.BufferAttribute(array=block['positions'])
+            block['object'] = self._make_object(
+                p3.BufferGeometry(attributes={'position': block['attribute']}))
+            block['object'].position = (self._origin[0], self._origin[1], self._z)
+            self.group.add(block['object'])
+        else:
+            block['attribute'].array = block['positions']
+            block['object'].visible = True
+
+    def append(self, x, y):
+        """
+        Append new samples.
+
+        Parameters
+        ----------
+        x:
+            The x coordinates of the new samples.
+        y:
+            The y coordinates of the new samples.
+        """
+        x = np.ravel(x)
+        y = np.ravel(y)
+        if len(x) == 0:
+            return
+        if self._origin is None:
+            self._origin = (float(x[0]), float(y[0]))
+        start = 0
+        while start < len(x):
+            if (not self._blocks) or (self._count == self._block_size):
+                self._next_block()
+            self._mark_dirty(self._blocks[-1])
+            positions = self._blocks[-1]['positions']
+            n = min(self._block_size - self._count, len(x) - start)
+            new = positions[1 + self._count:1 + self._count + n]
+            new[:, 0] = x[start:start + n] - self._origin[0]
+            new[:, 1] = y[start:start + n] - self._origin[1]
+            if len(self._blocks) == 1 and self._count == 0:
+                positions[0] = positions[1]
+            self._count += n
+            start += n
+            positions[1 + self._count:] = positions[self._count]
+
+    def flush(self):
+        """
+        Send the blocks modified since the last flush.
+        """
+        dirty, self._dirty = self._dirty, []
+        for block in dirty:
+            self._send(block)
+
+    def clear(self):
+        """
+        Remove all samples. The blocks are hidden and kept for reuse.
+        """
+        for block in self._blocks:
+            if block['object'] is not None:
+                block['object'].visible = False
+        self._spare = self._blocks[::-1] + self._spare
+        self._blocks = []
+        self._dirty = []
+        self._count = 0
+
+    def get_data(self):
+        """
+        Return the x and y coordinates of all the samples currently kept.
+        """
+        if not self._blocks:
+            return np.empty(0, dtype='float32'), np.empty(0, dtype='float32')
+        positions = np.concatenate(
+            [block['positions'][1:] for block in self._blocks[:-1]] +
+            [self._blocks[-1]['positions'][1:1 + self._count]])
+        return positions[:, 0] + self._origin[0], positions[:, 1] + self._origin[1]
+
+    def __len__(self):
+        return max(len(self._blocks) - 1, 0) * self._block_size + self._count
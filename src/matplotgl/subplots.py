@@ -8,7 +8,25 @@ from .axes import Axes
 from .widgets import VBar
 
 
-def subplots(nrows=1, ncols=1, **kwargs):
+def subplots(nrows=1, ncols=1, sharex=False, sharey=False, **kwargs):
+    """
+    Make a figure with a grid of axes.
+
+    Parameters
+    ----------
+    nrows:
+        The number of rows.
+    ncols:
+        The number of columns.
+    sharex:
+        Which axes share their x range: all of them (``True`` or ``'all'``), those
+        in the same row (``'row'``) or column (``'col'``), or none (``False`` or
+        ``'none'``). See :meth:`Axes.sharex`.
+    sharey:
+        Which axes share their y range, see ``sharex``.
+    **kwargs:
+        Forwarded to :class:`Figure`.
+    """
 
     fig = Figure(**kwargs)
     axs = [[Axes() for i in range(nrows)] for j in range(ncols)]
@@ -18,6 +36,19 @@ def subplots(nrows=1, ncols=1, **kwargs):
             ax.set_figure(fig, width=fig.width / ncols, height=fig.height / nrows)
         fig.add(VBar(col))
 
+    for share, method in ((sharex, Axes.sharex), (sharey, Axes.sharey)):
+        share = {True: 'all', False: 'none'}.get(share, share)
+        if share not in ('all', 'row', 'col', 'none'):
+            raise ValueError("Expected True, False, 'all', 'row', 'col' or 'none' for "
+                             f'sharex and sharey, got {share!r}.')
+        if share == 'none':
+            continue
+        for j, col in enumerate(axs):
+            for i, ax in enumerate(col):
+                ref = {'all': axs[0][0], 'row': axs[0][i], 'col': axs[j][0]}[share]
+                if ax is not ref:
+                    method(ax, ref)
+
     if nrows + ncols == 2:
         out = axs[0][0]
     elif ncols == 1:
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+from functools import lru_cache
+from typing import Tuple
+
+from matplotlib import ticker
+import numpy as np
+
+from .scale import LINEAR
+from .utils import value_to_string
+
+# Styles shared by all the tick labels, so that each label only carries its offset
+TICK_STYLE = ('<style>.mpgl-xl{position:absolute;top:4px}'
+              '.mpgl-xm{position:absolute;top:-6px}'
+              '.mpgl-yl{position:absolute;right:1px}</style>')
+
+
+def tick_bins(npixels: float, pixels_per_tick: float) -> int:
+    """
+    Maximum number of tick intervals fitting along an axis, following the rule used
+    by Matplotlib's ``AutoLocator``.
+
+    Parameters
+    ----------
+    npixels:
+        The length of the axis in pixels.
+    pixels_per_tick:
+        The minimum space needed by a tick label.
+    """
+    return int(max(1, min(npixels // pixels_per_tick, 9)))
+
+
+@lru_cache(maxsize=1024)
+def locate_ticks(vmin: float,
+                 vmax: float,
+                 nbins: int,
+                 scale=LINEAR) -> Tuple[Tuple[float, str]]:
+    """
+    Find nicely rounded tick values between ``vmin`` and ``vmax``, and make their
+    labels. Results are memoized, so that going back to a previous view (home,
+    undoing a zoom, resizing) does not run the locator again.
+
+    On log and symlog axes, ``vmin`` and ``vmax`` are scene coordinates (see
+    :class:`Scale`): the ticks are located in data coordinates with Matplotlib's
+    log locators, and returned at their positions in scene coordinates.
+
+    Parameters
+    ----------
+    vmin:
+        The lower bound of the axis.
+    vmax:
+        The upper bound of the axis.
+    nbins:
+        The maximum number of intervals between ticks.
+    scale:
+        The scale of the axis.
+    """
+    if not scale.linear:
+        return _locate_scaled_ticks(vmin, vmax, nbins, scale)
+    ticks = ticker.MaxNLocator(nbins=nbins, steps=[1, 2, 2.5, 5,
+                                                   10]).tick_values(vmin, vmax)
+    precision = max(-round(np.log10(vmax - vmin)) + 1, 0)
+    return tuple((tick, value_to_string(tick, precision=precision)) for tick in ticks)
+
+
+def _locate_scaled_ticks(vmin, vmax, nbins, scale):
+    low, high = scale.inverse([vmin, vmax])
+    if scale.name == 'log':
+        locator = ticker.LogLocator(base=10, numticks=nbins + 1)
+    else:
+        locator = ticker.SymmetricalLogLocator(base=10, linthresh=scale.linthresh)
+        locator.set_params(numticks=nbins + 1)
+    ticks = locator.tick_values(low, high)
+    if np.count_nonzero((ticks >= low) & (ticks <= high)) < 2:
+        # Zoomed in to less than a decade: fall back to linearly spaced ticks
+        ticks = locate_ticks(low, high, nbins)
+        positions = scale.forward([tick for tick, _ in ticks])
+        return tuple(zip(positions, (label for _, label in ticks)))
+    # The symlog locator does not limit the number of decades: keep every n-th
+    # decade, including zero
+    stride = -(-len(ticks) // (nbins + 1))
+    anchor = int(np.argmin(np.abs(ticks)))
+    ticks = ticks[anchor % stride::stride]
+    return tuple(zip(scale.forward(ticks), (_power_label(tick) for tick in ticks)))
+
+
+def _power_label(value: float) -> str:
+    """
+    Label a tick of a log axis, writing powers of ten as exponents.
+    """
+    if value == 0:
+        return '0'
+    exponent = np.log10(abs(value))
+    if not np.isclose(exponent, round(exponent)):
+        return value_to_string(value)
+    sign = '&#8722;' if value < 0 else ''
+    return f'{sign}10<sup>{round(exponent)}</sup>'
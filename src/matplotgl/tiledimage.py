@@ -0,0 +1,294 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2023 Matplotgl contributors (https://github.com/matplotgl)
+
+from collections import OrderedDict
+
+import numpy as np
+import pythreejs as p3
+
+from .artist import Artist
+from .image import Image
+
+
+class TiledImage(Artist):
+    """
+    An image too large to be sent as a single texture. The data is stored as a
+    pyramid of levels, each half the resolution of the previous one, cut into
+    square tiles. Only the tiles covering the visible range, at the level of
+    detail matching the screen resolution, are sent to the frontend. Tiles which
+    have already been sent are kept in a least-recently-used cache, so that
+    panning back to a region does not send them again.
+
+    Memory-mapped arrays, and lazy array-likes exposing ``shape`` and
+    ``__getitem__`` (e.g. arrays stored on disk in chunks), are not loaded. No
+    pyramid is precomputed for them: each tile is read on demand with a strided
+    slice, keeping one pixel in ``2**level`` along each dimension, so that memory
+    use is bounded by the size of the tile cache.
+
+    Parameters
+    ----------
+    array:
+        The 2D image data.
+    extent:
+        The ``[left, right, bottom, top]`` extent of the image.
+    cmap:
+        The colormap.
+    vmin:
+        The lower colour limit (defaults to the data minimum).
+    vmax:
+        The upper colour limit (defaults to the data maximum).
+    zorder:
+        The depth of the image.
+    tile_size:
+        The size of a tile in pixels.
+    cache_size:
+        The maximum number of tiles kept in the frontend.
+    **kwargs:
+        Forwarded to the :class:`Image` of each tile.
+    """
+
+    def __init__(self,
+                 array,
+                 extent=None,
+                 cmap='viridis',
+                 vmin=None,
+                 vmax=None,
+                 zorder=0,
+                 tile_size=512,
+                 cache_size=64,
+                 **kwargs):
+
+        super().__init__(zorder=zorder)
+        self._lazy = is_lazy(array)
+        if self._lazy:
+            self._array = array
+            self._shapes = _strided_shapes(array.shape[:2], tile_size)
+        else:
+            self._levels = _make_pyramid(np.asarray(array), tile_size)
+            self._shapes = [level.shape[:2] for level in self._levels]
+        shape = self._shapes[0]
+        self._extent = extent if extent is not None else [0, shape[1], 0, shape[0]]
+        # Size of one full-resolution pixel in data coordinates
+        self._dx = (self._extent[1] - self._extent[0]) / shape[1]
+        self._dy = (self._extent[3] - self._extent[2]) / shape[0]
+        self._cmap = cmap
+        # Lazy data is never read in full: the limits come from the coarsest level
+        sample = self._read(len(self._shapes) -
+                            1, 0, None, 0, None) if self._lazy else self._levels[0]
+        self._vmin = np.nanmin(sample) if vmin is None else vmin
+        self._vmax = np.nanmax(sample) if vmax is None else vmax
+        self._tile_size = tile_size
+        self._cache_size = cache_size
+        self._image_kwargs = kwargs
+        self._tiles = OrderedDict()
+        self._group = p3.Group()
+        self._box = self._extent
+        self._send({'tiles'})
+
+    def _choose_level(self, box):
+        """
+        Select the coarsest level whose pixels are not larger than screen pixels.
+        """
+        if self._ax is None:
+            return len(self._shapes) - 1
+        ratio = max((box[1] - box[0]) / (self._dx * self._ax.width),
+                    (box[3] - box[2]) / (self._dy * self._ax.height), 1)
+        return min(int(np.log2(ratio)), len(self._shapes) - 1)
+
+    def _visible_keys(self, level, box):
+        """
+        List the ``(level, row, column)`` keys of the tiles overlapping ``box``.
+        """
+        ny, nx = self._shapes[level]
+        width = self._tile_size * 2**level * self._dx
+        height = self._tile_size * 2**level * self._dy
+        col0 = max(int(np.floor((box[0] - self._extent[0]) / width)), 0)
+        col1 = min(int(np.ceil((box[1] - self._extent[0]) / width)),
+                   -(-nx // self._tile_size))
+        row0 = max(int(np.floor((box[2] - self._extent[2]) / height)), 0)
+        row1 = min(int(np.ceil((box[3] - self._extent[2]) / height)),
+                   -(-ny // self._tile_size))
+        return [(level, row, col) for row in range(row0, row1)
+                for col in range(col0, col1)]
+
+    def _read(self, level, row0, row1, col0, col1):
+        """
+        Read a block of a pyramid level, with bounds given in pixels of that level.
+        """
+        if not self._lazy:
+            return self._levels[level][row0:row1, col0:col1]
+        step = 2**level
+        rows = slice(row0 * step, None if row1 is None else row1 * step, step)
+        cols = slice(col0 * step, None if col1 is None else col1 * step, step)
+        return np.asarray(self._array[rows, cols])
+
+    def _read_tile(self, key):
+        level, row, col = key
+        size = self._tile_size
+        return self._read(level, row * size, (row + 1) * size, col * size,
+                          (col + 1) * size)
+
+    def _make_tile(self, key, data=None):
+        if data is None:
+            data = self._read_tile(key)
+        level, row, col = key
+        size = self._tile_size
+        scale = 2**level
+        left = self._extent[0] + col * size * scale * self._dx
+        bottom = self._extent[2] + row * size * scale * self._dy
+        # The last strided pixel of a lazy level may extend past the image edge
+        return Image(data,
+                     extent=[
+                         left,
+                         min(left + data.shape[1] * scale * self._dx, self._extent[1]),
+                         bottom,
+                         min(bottom + data.shape[0] * scale * self._dy, self._extent[3])
+                     ],
+                     cmap=self._cmap,
+                     vmin=self._vmin,
+                     vmax=self._vmax,
+                     zorder=self._zorder,
+                     **self._image_kwargs)
+
+    def _apply_zoom(self, box):
+        self._box = box
+        self._request_view(box)
+
+    def _compute_view(self, box):
+        """
+        Find the visible tiles, and read the data of those not in the cache.
+        """
+        keys = self._visible_keys(self._choose_level(box), box)
+        return keys, {
+            key: self._read_tile(key)
+            for key in keys if key not in self._tiles
+        }
+
+    def _send(self, parts):
+        if 'tiles' in parts:
+            self._cancel_view()
+            self._apply_view(self._compute_view(self._box))
+
+    def _apply_view(self, result):
+        keys, data = result
+        for key in keys:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+            else:
+                self._tiles[key] = self._make_tile(key, data.get(key))
+        # Evict the least recently used tiles, which are never the visible ones
+        while len(self._tiles) > max(self._cache_size, len(keys)):
+            _, tile = self._tiles.popitem(last=False)
+            widgets = [tile.get(), tile._material, tile._texture]
+            if tile._shader:
+                widgets.append(tile._lut)
+            for widget in widgets:
+                widget.close()
+            tile._release()
+        self._group.children = tuple(self._tiles[key].get() for key in keys)
+
+    def get_cmap(self):
+        return self._cmap
+
+    def set_cmap(self, cmap):
+        self._cmap = cmap
+        for tile in self._tiles.values():
+            tile.set_cmap(cmap)
+
+    def get_clim(self):
+        return self._vmin, self._vmax
+
+    def set_clim(self, vmin=None, vmax=None):
+        if vmin is not None:
+            self._vmin = vmin
+        if vmax is not None:
+            self._vmax = vmax
+        for tile in self._tiles.values():
+            tile.set_clim(self._vmin, self._vmax)
+
+    def _pick(self, x, y, scale, radius):
+        ny, nx = self._shapes[0]
+        col = int(np.floor((x - self._extent[0]) / self._dx))
+        row = int(np.floor((y - self._extent[2]) / self._dy))
+        if not (0 <= col < nx and 0 <= row < ny):
+            return None
+        return radius, {
+            'x': x,
+            'y': y,
+            'value': self._read(0, row, row + 1, col, col + 1)[0, 0]
+        }
+
+    def _check_scale(self, scale):
+        # The pixels would no longer be evenly spaced
+        if not scale.linear:
+            raise ValueError(f'Tiled images cannot be drawn on {scale.name} axes.')
+
+    def _compute_bbox(self):
+        return {
+            'left': self._extent[0],
+            'right': self._extent[1],
+            'bottom': self._extent[2],
+            'top': self._extent[3]
+        }
+
+    def _export_overrides(self, quantize, max_points):
+        out = {}
+        for tile in self._tiles.values():
+            out.update(tile._export_overrides(quantize, max_points))
+        return out
+
+    def _release(self):
+        for tile in self._tiles.values():
+            tile._release()
+
+    def get(self):
+        return self._group
+
+
+def is_lazy(array):
+    """
+    Whether an image should be read on demand instead of loaded in memory: true for
+    memory-mapped arrays and for array-likes which are not numpy arrays but expose
+    ``shape`` and ``__getitem__``.
+    """
+    if isinstance(array, np.ndarray):
+        return isinstance(array, np.memmap)
+    return hasattr(array, 'shape') and hasattr(array, '__getitem__')
+
+
+def _strided_shapes(shape, tile_size):
+    """
+    The shapes of the levels of a pyramid read with strided slices, keeping one
+    pixel in ``2**level``, until the whole image fits inside a single tile.
+    """
+    shapes = [tuple(shape)]
+    while max(shapes[-1]) > tile_size:
+        step = 2**len(shapes)
+        shapes.append((-(-shape[0] // step), -(-shape[1] // step)))
+    return shapes
+
+
+def _make_pyramid(array, tile_size):
+    """
+    Build the list of pyramid levels, halving the resolution until the whole image
+    fits inside a single tile. The first level is the input array itself.
+    """
+    levels = [array]
+    while max(levels[-1].shape) > tile_size:
+        levels.append(_block_mean(levels[-1]))
+    return levels
+
+
+def _block_mean(array):
+    """
+    Downsample an image by averaging blocks of 2x2 pixels, in float32. A trailing
+    odd row or column is dropped.
+    """
+    ny = array.shape[0] // 2 * 2
+    nx = array.shape[1] // 2 * 2
+    out = array[0:ny:2, 0:nx:2].astype(np.float32)
+    out += array[1:ny:2, 0:nx:2]
+    out += array[0:ny:2, 1:nx:2]
+    out += array[1:ny:2, 1:nx:2]
+    out *= 0.25
+    return out
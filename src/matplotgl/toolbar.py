@@ -18,4 +18,9 @@ class Toolbar(ipw.VBox):
                                          'width': '36px',
                                          'padding': '0'
                                      })
-        super().__init__([self._home, self._zoom])
+        self._hover = ipw.ToggleButton(icon='crosshairs',
+                                       layout={
+                                           'width': '36px',
+                                           'padding': '0'
+                                       })
+        super().__init__([self._home, self._zoom, self._hover])
@@ -1,6 +1,9 @@
-import pythreejs as p3
+import asyncio
 from typing import Tuple
 
+import numpy as np
+import pythreejs as p3
+
 
 def value_to_string(val, precision: int = 3) -> str:
     """
@@ -26,6 +29,52 @@ def value_to_string(val, precision: int = 3) -> str:
     return text
 
 
+def colormap_lut(cmap) -> np.ndarray:
+    """
+    Sample a colormap into a (256, 4) uint8 RGBA lookup table.
+
+    Parameters
+    ----------
+    cmap:
+        The Matplotlib colormap.
+    """
+    return cmap(np.linspace(0, 1, 256), bytes=True)
+
+
+def lut_indices(values, vmin: float, vmax: float) -> np.ndarray:
+    """
+    Map values to indices into a 256-entry colormap lookup table. Values outside the
+    ``[vmin, vmax]`` range are clipped to the ends of the table, NaNs are mapped to
+    the first entry.
+
+    Parameters
+    ----------
+    values:
+        The values to map.
+    vmin:
+        The value mapped to the first entry.
+    vmax:
+        The value mapped to the last entry.
+    """
+    scale = 256 / (vmax - vmin) if vmax > vmin else 0
+    # Subtract in the precision of the values (integers in float64, so that unsigned
+    # values below vmin do not wrap around), so that data with a large offset (e.g.
+    # timestamps) keeps its resolution, but store the result as float32
+    values = np.asarray(values)
+    t = np.empty(values.shape, dtype='float32')
+    np.subtract(values,
+                vmin,
+                out=t,
+                dtype='float64' if values.dtype.kind in 'iub' else None,
+                casting='unsafe')
+    t *= scale
+    # fmax returns the non-NaN argument, so this also maps NaNs to zero without
+    # allocating a mask
+    np.fmax(t, 0, out=t)
+    np.minimum(t, 255, out=t)
+    return t.astype(np.uint8)
+
+
 def make_sprite(string: str,
                 position: Tuple[float, float, float],
                 color: str = "black",
@@ -39,3 +88,34 @@ def make_sprite(string: str,
                                               squareTexture=False),
                            transparent=True)
     return p3.Sprite(material=sm, position=position, scale=[size, size, size])
+
+
+class Debouncer:
+    """
+    Wrap a function so that it only runs once calls have stopped arriving for
+    ``delay`` seconds, using the running event loop (the kernel's, in Jupyter).
+    Without a running event loop, calls go through immediately.
+
+    Parameters
+    ----------
+    func:
+        The function to wrap.
+    delay:
+        The quiet period, in seconds.
+    """
+
+    def __init__(self, func, delay: float = 0.1):
+        self._func = func
+        self._delay = delay
+        self._handle = None
+
+    def __call__(self, *args):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._func(*args)
+            return
+        self._handle = loop.call_later(self._delay, self._func, *args)